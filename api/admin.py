@@ -1,18 +1,77 @@
+import re
+
 from django.contrib import admin
+from django.contrib.postgres.search import SearchQuery
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import Product, LLMPrompt, LLMQueryResult
+from .services.llm.llm_service import clear_result_cache
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses Postgres' planner row estimate for unfiltered lists.
+
+    COUNT(*) is a full scan on large tables. When the changelist has no
+    filters or search applied, pg_class.reltuples is close enough for page
+    links; small tables and filtered lists still get an exact count.
+    """
+
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            connection = connections[queryset.db]
+            with connection.cursor() as cursor:
+                # regclass resolves the table through search_path, like the
+                # changelist query itself
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 for a table that has never been analyzed
+            if row and row[0] > max(self.exact_count_threshold, 0):
+                return row[0]
+        return super().count
+
+
+class ChangelistOnlyMixin:
+    """
+    Restrict changelist queries to the columns the list actually renders.
+
+    Large text/JSON columns are only loaded on the change form, where
+    every field is needed anyway.
+    """
+
+    changelist_only_fields = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.changelist_only_fields and self._is_changelist(request):
+            queryset = queryset.only(*self.changelist_only_fields)
+        return queryset
+
+    def _is_changelist(self, request):
+        match = request.resolver_match
+        opts = self.model._meta
+        return (
+            match is not None
+            and match.url_name == f"{opts.app_label}_{opts.model_name}_changelist"
+        )
 
 
 @admin.register(Product)
-class ProductAdmin(admin.ModelAdmin):
+class ProductAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ["upc_code", "name", "brand", "has_image", "created_at"]
+    changelist_only_fields = list_display
     search_fields = ["upc_code", "name", "brand"]
-    list_filter = ["created_at"]
+    list_filter = ["has_image", "created_at"]
     readonly_fields = ["image_preview"]
 
-    @admin.display(boolean=True, description="Has Image")
-    def has_image(self, obj):
-        return bool(obj.image_url)
-
     @admin.display(description="Image Preview")
     def image_preview(self, obj):
         if obj.image_url:
@@ -26,7 +85,7 @@ class ProductAdmin(admin.ModelAdmin):
 
 
 @admin.register(LLMPrompt)
-class LLMPromptAdmin(admin.ModelAdmin):
+class LLMPromptAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = [
         "name",
         "query_type",
@@ -35,6 +94,7 @@ class LLMPromptAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
     ]
+    changelist_only_fields = list_display
     list_filter = ["query_type", "is_active", "created_at"]
     search_fields = ["name", "description", "prompt_template"]
     readonly_fields = ["created_at", "updated_at"]
@@ -63,7 +123,7 @@ class LLMPromptAdmin(admin.ModelAdmin):
 
 
 @admin.register(LLMQueryResult)
-class LLMQueryResultAdmin(admin.ModelAdmin):
+class LLMQueryResultAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = [
         "product",
         "prompt",
@@ -80,11 +140,30 @@ class LLMQueryResultAdmin(admin.ModelAdmin):
         "created_at",
         "prompt__query_type",
     ]
+    list_select_related = ["product", "prompt"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    changelist_only_fields = [
+        "product",
+        "prompt",
+        "provider",
+        "parse_strategy",
+        "parse_attempts",
+        "is_stale",
+        "created_at",
+        "product__name",
+        "prompt__name",
+        "prompt__query_type",
+    ]
     search_fields = ["product__name", "product__upc_code"]
+    search_help_text = (
+        "Search by UPC, or by the start of words in the product name or result"
+    )
     readonly_fields = [
         "created_at",
         "updated_at",
         "query_input",
+        "query_fingerprint",
         "result",
         "metadata",
         "parse_strategy",
@@ -95,7 +174,10 @@ class LLMQueryResultAdmin(admin.ModelAdmin):
 
     fieldsets = (
         ("Query Information", {"fields": ("product", "prompt", "provider")}),
-        ("Request & Response", {"fields": ("query_input", "result", "metadata")}),
+        (
+            "Request & Response",
+            {"fields": ("query_input", "query_fingerprint", "result", "metadata")},
+        ),
         (
             "Parsing Details",
             {"fields": ("parse_strategy", "parse_attempts", "schema_version")},
@@ -109,11 +191,32 @@ class LLMQueryResultAdmin(admin.ModelAdmin):
 
     actions = ["mark_as_stale", "mark_as_fresh"]
 
+    def get_search_results(self, request, queryset, search_term):
+        # UPC lookups keep the default substring search; everything else goes
+        # through the GIN-indexed search_vector instead of ILIKE scans. Each
+        # word is matched as a prefix ("cheer" finds "Cheerios"), but unlike
+        # the default search, text in the middle of a word isn't matched.
+        words = re.findall(r"\w+", search_term)
+        if not words or search_term.isdigit():
+            return super().get_search_results(request, queryset, search_term)
+
+        raw_query = " & ".join(f"{word}:*" for word in words)
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute("SELECT numnode(to_tsquery('english', %s))", [raw_query])
+            if not cursor.fetchone()[0]:
+                # Only stopwords ("the", "with"), which the english config
+                # drops, leaving nothing to match
+                return super().get_search_results(request, queryset, search_term)
+
+        query = SearchQuery(raw_query, config="english", search_type="raw")
+        return queryset.filter(search_vector=query), False
+
     @admin.action(
         description="Mark selected results as stale (will be refreshed on next request)"
     )
     def mark_as_stale(self, request, queryset):
         count = queryset.update(is_stale=True)
+        clear_result_cache()
         self.message_user(request, f"{count} result(s) marked as stale.")
 
     @admin.action(description="Mark selected results as fresh")
@@ -1,6 +1,18 @@
+import threading
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        if settings.LLM_WARMUP_ON_STARTUP:
+            from .services.llm import LLMService
+
+            # In the background so a slow provider doesn't hold up startup
+            threading.Thread(target=LLMService().warmup, daemon=True).start()
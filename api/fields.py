@@ -0,0 +1,31 @@
+import orjson
+from django.db import models
+from psycopg.types.json import Jsonb
+
+
+def _dumps(value):
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+class OrjsonField(models.JSONField):
+    """
+    JSONField that (de)serializes with orjson instead of the stdlib json module.
+
+    Falls back to the stock JSONField behaviour when a custom encoder/decoder
+    is configured, since orjson can't use json.JSONEncoder/JSONDecoder classes.
+    """
+
+    def from_db_value(self, value, expression, connection):
+        if self.decoder is not None or not isinstance(value, (str, bytes)):
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if self.encoder is not None or connection.vendor != "postgresql":
+            return super().get_db_prep_value(value, connection, prepared)
+        if not prepared:
+            value = self.get_prep_value(value)
+        return Jsonb(value, dumps=_dumps)
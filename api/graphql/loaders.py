@@ -0,0 +1,76 @@
+"""
+Request-scoped batching for LLM insight fields.
+
+Resolving reviewSummary/safetyAnalysis on a list of products would otherwise
+check the LLM result cache once per product. The list resolver calls
+prefetch_insights() so every cache lookup for the page happens in one query.
+"""
+
+from graphql import GraphQLString, GraphQLBoolean
+from graphql.language import FieldNode
+from graphql.utilities import value_from_ast
+
+from api.services.llm import LLMService
+
+# GraphQL field name -> LLM query_type
+INSIGHT_FIELDS = {
+    "reviewSummary": "review_summary",
+    "safetyAnalysis": "safety_analysis",
+}
+
+
+def get_llm_service(info):
+    """Return the LLMService shared by every resolver in the current request."""
+    context = info.context
+    if context is None:
+        return LLMService()
+
+    service = getattr(context, "llm_service", None)
+    if service is None:
+        service = LLMService()
+        context.llm_service = service
+    return service
+
+
+def prefetch_insights(info, products):
+    """
+    Batch the cache lookups for insight fields selected under a product list.
+
+    Args:
+        info: GraphQL resolve info for the list field
+        products: The products that are about to be resolved
+    """
+    if info.context is None:
+        # No request to share an LLMService through, so nothing to batch into
+        return
+
+    requested = set()
+    for field_node in info.field_nodes:
+        if not field_node.selection_set:
+            continue
+        for selection in field_node.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                continue
+            query_type = INSIGHT_FIELDS.get(selection.name.value)
+            if query_type is None:
+                continue
+
+            args = {arg.name.value: arg.value for arg in selection.arguments or ()}
+            force_refresh = "forceRefresh" in args and value_from_ast(
+                args["forceRefresh"], GraphQLBoolean, info.variable_values
+            )
+            if force_refresh:
+                continue
+            provider = (
+                value_from_ast(args["provider"], GraphQLString, info.variable_values)
+                if "provider" in args
+                else None
+            )
+            requested.add((query_type, provider))
+
+    if not requested:
+        return
+
+    llm_service = get_llm_service(info)
+    for query_type, provider in requested:
+        llm_service.prefetch_cache(products, query_type, provider=provider)
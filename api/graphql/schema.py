@@ -1,44 +1,112 @@
 import graphene
+from graphene.utils.str_converters import to_camel_case
+from graphql import GraphQLError
+from graphql.language import FieldNode
 from api.models import Product
 from api.graphql.types import ProductType
+from api.graphql.loaders import INSIGHT_FIELDS, prefetch_insights
 from api.services.de_product_api import DEProductAPI
 
+# GraphQL field name -> Product column for fields ProductType maps 1:1
+PRODUCT_COLUMNS = {
+    to_camel_case(field.name): field.name
+    for field in Product._meta.concrete_fields
+    if field.name in ProductType._meta.fields
+}
+
+# Columns LLMPrompt.render reads when an insight has to be generated.
+# de_product_data is never exposed by ProductType and only loaded (lazily) for
+# templates that use {additional_data}, so every product query defers it.
+INSIGHT_COLUMNS = ("name", "brand", "upc_code")
+
+# allProducts page sizes, so a single query can't load the whole table
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+def selected_product_columns(info):
+    """
+    Work out which Product columns a product list query actually needs.
+
+    Args:
+        info: GraphQL resolve info for the list field
+
+    Returns:
+        Tuple of column names for QuerySet.only(), or None if the selection
+        uses fragments and can't be resolved without walking them
+    """
+    columns = {"id"}
+    for field_node in info.field_nodes:
+        if not field_node.selection_set:
+            continue
+        for selection in field_node.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                return None
+            name = selection.name.value
+            if name in PRODUCT_COLUMNS:
+                columns.add(PRODUCT_COLUMNS[name])
+            elif name in INSIGHT_FIELDS:
+                columns.update(INSIGHT_COLUMNS)
+    return tuple(columns)
+
 
 class Query(graphene.ObjectType):
-    all_products = graphene.List(ProductType)
+    all_products = graphene.List(
+        ProductType,
+        limit=graphene.Int(
+            description=(
+                "Maximum number of products to return "
+                f"(default {DEFAULT_PAGE_SIZE}, at most {MAX_PAGE_SIZE})"
+            )
+        ),
+        offset=graphene.Int(description="Number of products to skip"),
+    )
     product_by_upc = graphene.Field(ProductType, upc=graphene.String(required=True))
     product_by_id = graphene.Field(ProductType, id=graphene.Int(required=True))
 
-    def resolve_all_products(self, info):
+    def resolve_all_products(self, info, limit=None, offset=0):
         # Access authenticated user via info.context.user
         # user = info.context.user
         # if not user.is_authenticated:
         #     raise Exception('Authentication required')
-        return Product.objects.all()
+        limit = DEFAULT_PAGE_SIZE if limit is None else limit
+        offset = offset or 0
+        if limit < 0 or offset < 0:
+            raise GraphQLError("limit and offset must not be negative")
+        if limit > MAX_PAGE_SIZE:
+            raise GraphQLError(f"limit must be at most {MAX_PAGE_SIZE}")
+
+        columns = selected_product_columns(info)
+        if columns is not None:
+            products = Product.objects.only(*columns).order_by("id")
+        else:
+            products = Product.objects.defer("de_product_data").order_by("id")
+        products = list(products[offset : offset + limit])
+
+        prefetch_insights(info, products)
+        return products
 
     def resolve_product_by_upc(self, info, upc):
-        products = Product.objects.filter(upc_code=upc)
-        if products.exists():
-            return products.first()
+        product = Product.objects.defer("de_product_data").filter(upc_code=upc).first()
+        if product:
+            return product
+
+        de_product_api = DEProductAPI()
+        de_product = de_product_api.get_product(upc)
+        if de_product:
+            return Product.objects.create(
+                upc_code=upc,
+                name=de_product["description"],
+                brand=de_product["brand"],
+                image_url=de_product.get("image"),
+                de_product_data=de_product,
+            )
         else:
-            de_product_api = DEProductAPI()
-            de_product = de_product_api.get_product(upc)
-            if de_product:
-                product = Product.objects.create(
-                    upc_code=upc,
-                    name=de_product["description"],
-                    brand=de_product["brand"],
-                    image_url=de_product.get("image"),
-                    de_product_data=de_product,
-                )
-                product.save()
-                return product
-            else:
-                return None
+            return None
 
     def resolve_product_by_id(self, info, id):
         try:
-            return Product.objects.get(id=id)
+            return Product.objects.defer("de_product_data").get(id=id)
         except Product.DoesNotExist:
             return None
 
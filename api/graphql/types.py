@@ -2,7 +2,7 @@ import graphene
 from graphene_django import DjangoObjectType
 from graphene.types.generic import GenericScalar
 from api.models import Product, LLMPrompt
-from api.services.llm import LLMService
+from api.graphql.loaders import get_llm_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -159,38 +159,7 @@ class ProductType(DjangoObjectType):
         Returns:
             ReviewSummaryType with structured data and metadata
         """
-        try:
-            llm_service = LLMService()
-            provider_name = provider or llm_service.default_provider_name
-
-            # Get insight from LLM service (handles caching internally)
-            result = llm_service.get_product_insight(
-                product=self,
-                query_type="review_summary",
-                provider=provider,
-                force_refresh=force_refresh,
-            )
-
-            # Add metadata to response
-            content = result["content"]
-            if isinstance(content, dict):
-                content["_metadata"] = {
-                    "provider": provider_name,
-                    "cached": result["cached"],
-                    "generated_at": result["result_obj"].created_at,
-                }
-                return content
-            else:
-                # Fallback for error responses
-                logger.warning(f"Non-dict content returned: {content}")
-                return None
-
-        except LLMPrompt.DoesNotExist:
-            logger.warning("No active 'review_summary' prompt found")
-            return None
-        except Exception as e:
-            logger.error(f"Error resolving review_summary: {e}", exc_info=True)
-            return None
+        return resolve_insight(self, info, "review_summary", provider, force_refresh)
 
     def resolve_safety_analysis(self, info, provider=None, force_refresh=False):
         """
@@ -203,34 +172,56 @@ class ProductType(DjangoObjectType):
         Returns:
             SafetyAnalysisType with structured data and metadata
         """
-        try:
-            llm_service = LLMService()
-            provider_name = provider or llm_service.default_provider_name
-
-            # Get insight from LLM service (handles caching internally)
-            result = llm_service.get_product_insight(
-                product=self,
-                query_type="safety_analysis",
-                provider=provider,
-                force_refresh=force_refresh,
-            )
-
-            # Add metadata to response
-            content = result["content"]
-            if isinstance(content, dict):
-                content["_metadata"] = {
-                    "provider": provider_name,
+        return resolve_insight(self, info, "safety_analysis", provider, force_refresh)
+
+
+def resolve_insight(product, info, query_type, provider=None, force_refresh=False):
+    """
+    Fetch an LLM insight for a product through the request's shared LLMService.
+
+    Args:
+        product: Product being resolved
+        info: GraphQL resolve info
+        query_type: Type of query (e.g., 'review_summary')
+        provider: Optional LLM provider to use
+        force_refresh: If True, bypass cache and query LLM directly
+
+    Returns:
+        Insight content dict with a '_metadata' entry, or None on failure
+    """
+    try:
+        llm_service = get_llm_service(info)
+
+        # Get insight from LLM service (handles caching internally)
+        result = llm_service.get_product_insight(
+            product=product,
+            query_type=query_type,
+            provider=provider,
+            force_refresh=force_refresh,
+        )
+
+        # Add metadata to a copy so the cached result is left untouched
+        # result_obj already records which provider answered, so there is no
+        # need to re-derive the default from the service/settings per field.
+        content = result["content"]
+        result_obj = result["result_obj"]
+        if isinstance(content, dict):
+            return {
+                **content,
+                "_metadata": {
+                    "provider": result_obj.provider,
                     "cached": result["cached"],
-                    "generated_at": result["result_obj"].created_at,
-                }
-                return content
-            else:
-                logger.warning(f"Non-dict content returned: {content}")
-                return None
-
-        except LLMPrompt.DoesNotExist:
-            logger.warning("No active 'safety_analysis' prompt found")
-            return None
-        except Exception as e:
-            logger.error(f"Error resolving safety_analysis: {e}", exc_info=True)
+                    "generated_at": result_obj.created_at,
+                },
+            }
+        else:
+            # Fallback for error responses
+            logger.warning("Non-dict content returned: %s", content)
             return None
+
+    except LLMPrompt.DoesNotExist:
+        logger.warning("No active '%s' prompt found", query_type)
+        return None
+    except Exception as e:
+        logger.error("Error resolving %s: %s", query_type, e, exc_info=True)
+        return None
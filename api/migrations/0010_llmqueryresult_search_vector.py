@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:35
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+CREATE_TRIGGER_SQL = """
+CREATE FUNCTION api_llmqueryresult_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(
+            (SELECT name || ' ' || upc_code FROM api_product WHERE id = NEW.product_id),
+            ''
+        )), 'A')
+        || setweight(jsonb_to_tsvector('english', NEW.result, '["string"]'), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER api_llmqueryresult_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF result, product_id ON api_llmqueryresult
+    FOR EACH ROW EXECUTE FUNCTION api_llmqueryresult_search_vector_update();
+
+UPDATE api_llmqueryresult SET product_id = product_id;
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS api_llmqueryresult_search_vector_trigger ON api_llmqueryresult;
+DROP FUNCTION IF EXISTS api_llmqueryresult_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0009_add_image_url_to_product"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="llmqueryresult",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text index of the product name, UPC and result text (maintained by a database trigger)",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="llmqueryresult",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="llmresult_search_gin"
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, reverse_sql=DROP_TRIGGER_SQL),
+    ]
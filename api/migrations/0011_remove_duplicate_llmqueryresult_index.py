@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:39
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0010_llmqueryresult_search_vector"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="llmqueryresult",
+            name="api_llmquer_product_6126fb_idx",
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+
+def backfill_has_image(apps, schema_editor):
+    Product = apps.get_model("api", "Product")
+    Product.objects.exclude(image_url__isnull=True).exclude(image_url="").update(
+        has_image=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0011_remove_duplicate_llmqueryresult_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="has_image",
+            field=models.BooleanField(
+                db_index=True,
+                default=False,
+                editable=False,
+                help_text="Denormalized from image_url on save",
+            ),
+        ),
+        migrations.RunPython(backfill_has_image, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:46
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0012_product_has_image"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["de_product_data"],
+                name="prod_de_data_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="prod_created_brin", pages_per_range=32
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0013_product_de_data_gin_created_brin"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="llmqueryresult",
+            name="api_llmquer_is_stal_b82c12_idx",
+        ),
+        migrations.AddIndex(
+            model_name="llmqueryresult",
+            index=models.Index(
+                fields=["is_stale", "created_at"], name="api_llmquer_is_stal_d182e3_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:48
+
+import api.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0014_llmqueryresult_fresh_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="llmprompt",
+            name="response_schema",
+            field=api.fields.OrjsonField(
+                blank=True,
+                help_text="Expected JSON schema for the response (optional, for validation)",
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="llmqueryresult",
+            name="metadata",
+            field=api.fields.OrjsonField(
+                blank=True,
+                default=dict,
+                help_text="Additional data like tokens used, model version, cost estimate",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="llmqueryresult",
+            name="result",
+            field=api.fields.OrjsonField(
+                help_text="The structured JSON response from the LLM"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="product",
+            name="de_product_data",
+            field=api.fields.OrjsonField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0015_use_orjson_field"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="llmqueryresult",
+            name="query_fingerprint",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="SHA-256 of the normalized query input, to reuse results across equivalent prompts",
+                max_length=64,
+            ),
+        ),
+    ]
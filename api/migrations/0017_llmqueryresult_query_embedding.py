@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:11
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0016_llmqueryresult_query_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="llmqueryresult",
+            name="query_embedding",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.FloatField(),
+                blank=True,
+                editable=False,
+                help_text="Embedding of the query input, used by the semantic cache",
+                null=True,
+                size=None,
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:52
+
+from django.db import migrations
+
+# search_vector includes the product's name and UPC (see 0010), so refresh
+# the product's results when either changes. Setting product_id to itself
+# fires the BEFORE UPDATE OF product_id trigger that rebuilds the vector.
+CREATE_TRIGGER_SQL = """
+CREATE FUNCTION api_product_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    UPDATE api_llmqueryresult SET product_id = product_id
+    WHERE product_id = NEW.id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER api_product_search_vector_trigger
+    AFTER UPDATE OF name, upc_code ON api_product
+    FOR EACH ROW
+    WHEN (OLD.name IS DISTINCT FROM NEW.name
+          OR OLD.upc_code IS DISTINCT FROM NEW.upc_code)
+    EXECUTE FUNCTION api_product_search_vector_update();
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS api_product_search_vector_trigger ON api_product;
+DROP FUNCTION IF EXISTS api_product_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0017_llmqueryresult_query_embedding"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGER_SQL, reverse_sql=DROP_TRIGGER_SQL),
+    ]
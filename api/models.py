@@ -1,5 +1,16 @@
+import hashlib
+from datetime import timedelta
+from functools import lru_cache
+from string import Formatter
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import BrinIndex, GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
+
+from api.fields import OrjsonField
 
 
 class Product(models.Model):
@@ -7,17 +18,70 @@ class Product(models.Model):
     name = models.CharField(max_length=255, null=False)
     brand = models.CharField(max_length=255, null=True, blank=True)
     image_url = models.URLField(max_length=500, null=True, blank=True)
-    de_product_data = models.JSONField(null=True, blank=True)
+    has_image = models.BooleanField(
+        default=False,
+        db_index=True,
+        editable=False,
+        help_text="Denormalized from image_url on save",
+    )
+    de_product_data = OrjsonField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Containment (@>) lookups into the raw DE API payload
+            GinIndex(
+                fields=["de_product_data"],
+                opclasses=["jsonb_path_ops"],
+                name="prod_de_data_gin",
+            ),
+            # Rows are append-mostly, so created_at follows physical order
+            BrinIndex(
+                fields=["created_at"], name="prod_created_brin", pages_per_range=32
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.has_image = bool(self.image_url)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "image_url" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "has_image"}
+        super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         return reverse("book-detail", args=[str(self.id)])
 
 
+@lru_cache(maxsize=128)
+def _template_fields(template):
+    """Return the set of replacement field names used by a format template."""
+    return frozenset(
+        field_name for _, field_name, _, _ in Formatter().parse(template) if field_name
+    )
+
+
+@lru_cache(maxsize=128)
+def _compile_template(template):
+    """
+    Split a format template into (literal, field_name) pairs once per template.
+
+    Returns None for templates using conversions, format specs or
+    attribute/index lookups, which need the full str.format() machinery.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
 class LLMPrompt(models.Model):
     """Template for LLM queries with variable substitution"""
 
@@ -32,7 +96,7 @@ class LLMPrompt(models.Model):
         max_length=50,
         help_text="Category of query (e.g., 'review_summary', 'safety_analysis')",
     )
-    response_schema = models.JSONField(
+    response_schema = OrjsonField(
         null=True,
         blank=True,
         help_text="Expected JSON schema for the response (optional, for validation)",
@@ -58,16 +122,47 @@ class LLMPrompt(models.Model):
 
     def render(self, product):
         """Render the prompt template with product data"""
-        return self.prompt_template.format(
-            product_name=product.name or "Unknown Product",
-            brand=product.brand or "Unknown Brand",
-            upc_code=product.upc_code,
-            additional_data=(
-                str(product.de_product_data) if product.de_product_data else ""
-            ),
+        # Stringifying the DE payload is costly (and loads the column if it
+        # was deferred), so only do it for templates that reference it
+        additional_data = ""
+        if "additional_data" in _template_fields(self.prompt_template):
+            if product.de_product_data:
+                additional_data = str(product.de_product_data)
+
+        values = {
+            "product_name": product.name or "Unknown Product",
+            "brand": product.brand or "Unknown Brand",
+            "upc_code": product.upc_code,
+            "additional_data": additional_data,
+        }
+
+        compiled = _compile_template(self.prompt_template)
+        if compiled is None:
+            return self.prompt_template.format(**values)
+        return "".join(
+            literal if field_name is None else literal + values[field_name]
+            for literal, field_name in compiled
         )
 
 
+class LLMQueryResultQuerySet(models.QuerySet):
+    # Columns only needed when inspecting a single result (admin change form)
+    large_fields = ("query_input", "search_vector", "query_embedding")
+
+    def without_large_fields(self):
+        """Skip the rendered prompt text and full-text vector"""
+        return self.defer(*self.large_fields)
+
+    def with_related(self):
+        """Join product and prompt for listings that display them (e.g. __str__)"""
+        return self.select_related("product", "prompt").without_large_fields()
+
+    def fresh(self, ttl_days=30):
+        """Results that are not marked stale and are younger than ttl_days"""
+        cutoff = timezone.now() - timedelta(days=ttl_days)
+        return self.filter(is_stale=False, created_at__gt=cutoff)
+
+
 class LLMQueryResult(models.Model):
     """Cached results from LLM queries"""
 
@@ -84,7 +179,20 @@ class LLMQueryResult(models.Model):
     query_input = models.TextField(
         help_text="The actual rendered prompt sent to the LLM"
     )
-    result = models.JSONField(help_text="The structured JSON response from the LLM")
+    query_fingerprint = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text="SHA-256 of the normalized query input, to reuse results across equivalent prompts",
+    )
+    query_embedding = ArrayField(
+        models.FloatField(),
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Embedding of the query input, used by the semantic cache",
+    )
+    result = OrjsonField(help_text="The structured JSON response from the LLM")
     schema_version = models.CharField(
         max_length=20,
         default="1.0",
@@ -100,7 +208,7 @@ class LLMQueryResult(models.Model):
         blank=True,
         help_text="JSON parsing strategy that succeeded (e.g., 'direct', 'markdown_json', 'markdown_block', 'extract_braces')",
     )
-    metadata = models.JSONField(
+    metadata = OrjsonField(
         default=dict,
         blank=True,
         help_text="Additional data like tokens used, model version, cost estimate",
@@ -109,16 +217,25 @@ class LLMQueryResult(models.Model):
         default=False,
         help_text="Mark for refresh if data is outdated",
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Full-text index of the product name, UPC and result text (maintained by a database trigger)",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LLMQueryResultQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        # (product, prompt, provider) lookups use the unique_together index
         indexes = [
-            models.Index(fields=["product", "prompt", "provider"]),
             models.Index(fields=["provider"]),
             models.Index(fields=["created_at"]),
-            models.Index(fields=["is_stale"]),
+            # Serves fresh(): equality on is_stale, range on created_at
+            models.Index(fields=["is_stale", "created_at"]),
+            GinIndex(fields=["search_vector"], name="llmresult_search_gin"),
         ]
         unique_together = ["product", "prompt", "provider"]
         verbose_name = "LLM Query Result"
@@ -126,10 +243,13 @@ class LLMQueryResult(models.Model):
     def __str__(self):
         return f"{self.product.name} - {self.prompt.name} ({self.provider})"
 
+    @staticmethod
+    def make_fingerprint(query_input):
+        """SHA-256 of the prompt with case and whitespace differences removed"""
+        normalized = " ".join(query_input.lower().split())
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
     def is_fresh(self, ttl_days=30):
         """Check if the cached result is still fresh"""
-        from django.utils import timezone
-        from datetime import timedelta
-
         age = timezone.now() - self.created_at
         return age < timedelta(days=ttl_days) and not self.is_stale
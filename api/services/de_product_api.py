@@ -1,12 +1,74 @@
+import orjson
 import requests
 import hmac
 import hashlib
 import base64
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeout in seconds for DE API requests
+REQUEST_TIMEOUT = (3.05, 10)
+
+
+def _build_session():
+    """Create a pooled session that retries transient DE API failures."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        # Hand the last response back so get_product reports the status
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# 8-digit (UPC-E/EAN-8) and 12-digit (UPC-A) codes, the lengths
+# Product.upc_code can hold
+UPC_PATTERN = re.compile(r"\d{8}|\d{12}")
+
+
+def is_valid_upc(upc_code):
+    """
+    Check that a UPC has a valid length and, for UPC-A, a valid check digit.
+
+    8-digit codes are only length-checked: a UPC-E check digit comes from
+    its expanded UPC-A form, so a direct mod-10 would reject real codes.
+
+    Args:
+        upc_code: The code to check
+
+    Returns:
+        True if the code could be a real barcode, False otherwise
+    """
+    if not isinstance(upc_code, str) or not UPC_PATTERN.fullmatch(upc_code):
+        return False
+    if len(upc_code) == 8:
+        return True
+    # Weights alternate 3, 1, 3, ... starting from the digit left of the check digit
+    total = sum(int(d) for d in upc_code[-2::-2]) * 3
+    total += sum(int(d) for d in upc_code[-3::-2])
+    return (10 - total % 10) % 10 == int(upc_code[-1])
+
+
+# Distinguishes a cached "not found" (None) from a cache miss
+_NOT_CACHED = object()
+
+# Shared by every DEProductAPI instance so lookups reuse keep-alive
+# connections instead of doing a fresh TCP/TLS handshake per UPC
+_session = _build_session()
+
 
 class DEProductAPI:
     """
@@ -29,6 +91,9 @@ class DEProductAPI:
         self.auth_key = config.get("auth_key")
         self.field_names = config.get("field_names")
         self.language = config.get("language", "en")
+        self.max_workers = config.get("max_workers", 16)
+        self.cache_ttl = config.get("cache_ttl_seconds", 7 * 24 * 60 * 60)
+        self.not_found_cache_ttl = config.get("not_found_cache_ttl_seconds", 60 * 60)
 
         # Validate required configuration
         if not self.base_url:
@@ -52,11 +117,51 @@ class DEProductAPI:
                 "Set it in your environment or Django settings."
             )
 
-        logger.info(f"DEProductAPI initialized with base_url: {self.base_url}")
+        # Responses depend on the requested fields and language as well as UPC
+        fields_digest = hashlib.sha1(self.field_names.encode("utf-8")).hexdigest()[:8]
+        self._cache_prefix = f"de_product:{self.language}:{fields_digest}"
+
+        # Keyed HMAC with no message yet; copied per token so the key schedule
+        # is only computed once per client
+        self._hmac_proto = hmac.new(self.auth_key.encode("utf-8"), None, hashlib.sha1)
+
+        logger.info("DEProductAPI initialized with base_url: %s", self.base_url)
 
     def get_product(self, upc_code):
         """
-        Fetch product data by UPC code.
+        Fetch product data by UPC code, using the Django cache when possible.
+
+        DE product data rarely changes, so both found products and "not
+        found" answers are cached (the latter for a shorter time).
+
+        Args:
+            upc_code: The UPC code to look up
+
+        Returns:
+            Product data dictionary if found, None otherwise
+
+        Raises:
+            Exception: If the API request fails
+        """
+        if not is_valid_upc(upc_code):
+            # No barcode can match, so don't spend a round trip finding out
+            logger.debug("Skipping DE Product API lookup for invalid UPC %s", upc_code)
+            return None
+
+        cache_key = f"{self._cache_prefix}:{upc_code}"
+        product = cache.get(cache_key, _NOT_CACHED)
+        if product is not _NOT_CACHED:
+            logger.debug("DE Product API cache hit for UPC %s", upc_code)
+            return product
+
+        product = self._fetch_product(upc_code)
+        ttl = self.cache_ttl if product is not None else self.not_found_cache_ttl
+        cache.set(cache_key, product, ttl)
+        return product
+
+    def _fetch_product(self, upc_code):
+        """
+        Query the DE Product API for a UPC code, bypassing the cache.
 
         Args:
             upc_code: The UPC code to look up
@@ -76,22 +181,47 @@ class DEProductAPI:
             "field_names": self.field_names,
         }
 
-        logger.debug(f"Querying DE Product API with params: {query_params}")
-        response = requests.get(self.base_url, params=query_params)
+        logger.debug("Querying DE Product API with params: %s", query_params)
+        response = _session.get(
+            self.base_url, params=query_params, timeout=REQUEST_TIMEOUT
+        )
 
         if response.status_code != 200:
             raise Exception(
                 f"Failed to get product: {response.status_code} {response.text}"
             )
 
-        result = response.json()
-        logger.debug(f"API Response: {result}")
+        result = orjson.loads(response.content)
+        logger.debug("API Response: %s", result)
 
         if int(result["entries"]) > 0:
             return result["products"][0]
         else:
             return None
 
+    def get_products(self, upc_codes):
+        """
+        Fetch product data for several UPC codes concurrently.
+
+        Args:
+            upc_codes: Iterable of UPC codes to look up
+
+        Returns:
+            Dictionary mapping each UPC code to its product data, or None if
+            the product was not found
+
+        Raises:
+            Exception: If any of the API requests fail
+        """
+        upc_codes = list(dict.fromkeys(upc_codes))
+        if not upc_codes:
+            return {}
+
+        workers = min(self.max_workers, len(upc_codes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {upc: executor.submit(self.get_product, upc) for upc in upc_codes}
+            return {upc: future.result() for upc, future in futures.items()}
+
     def make_auth_token(self, arg):
         """
         Generate HMAC-SHA1 authentication token.
@@ -102,7 +232,6 @@ class DEProductAPI:
         Returns:
             Base64-encoded authentication token
         """
-        sha_hash = hmac.new(
-            self.auth_key.encode("utf-8"), arg.encode("utf-8"), hashlib.sha1
-        )
-        return base64.b64encode(sha_hash.digest()).decode("utf-8")
+        sha_hash = self._hmac_proto.copy()
+        sha_hash.update(arg.encode("utf-8"))
+        return base64.b64encode(sha_hash.digest()).decode("ascii")
@@ -2,16 +2,43 @@
 Abstract base class for LLM providers.
 """
 
+import asyncio
+import httpx
+import random
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
+from .rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Provider retries run inside a web request, so together with the request
+# itself they must finish well within the 60s gunicorn worker timeout
+RETRY_MAX_DELAY = 5.0
+RETRY_MAX_TOTAL_DELAY = 10.0
+
+# Failures that happen before the request is sent, so retrying can't bill a
+# request twice (unlike a read timeout, which the provider may still answer)
+RETRYABLE_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers"""
 
+    # Providers are long-lived and hold a fixed set of attributes, so skip the
+    # per-instance __dict__. Subclasses declare their own attributes.
+    __slots__ = (
+        "api_key",
+        "config",
+        "max_retries",
+        "backoff_base",
+        "rate_limiter",
+        "async_clients",
+        "async_clients_lock",
+    )
+
     def __init__(self, api_key: str, **kwargs):
         """
         Initialize the provider.
@@ -22,6 +49,15 @@ class BaseLLMProvider(ABC):
         """
         self.api_key = api_key
         self.config = kwargs
+        # Rate-limited requests and failed connections are retried with
+        # exponential backoff before an error is raised
+        self.max_retries = kwargs.get("max_retries", 2)
+        self.backoff_base = kwargs.get("backoff_base", 1.0)
+        # Shared requests-per-minute limit, taken once per HTTP attempt
+        self.rate_limiter = get_rate_limiter(self.provider_name, kwargs.get("rpm"))
+        # Async HTTP clients by event loop; see _get_async_client()
+        self.async_clients = weakref.WeakKeyDictionary()
+        self.async_clients_lock = threading.Lock()
         self._validate_config()
 
     def _validate_config(self):
@@ -59,6 +95,88 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def aquery(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """
+        Async version of query().
+
+        The default runs query() in a worker thread; providers with an async
+        HTTP client override it.
+
+        Args:
+            prompt: The prompt text to send
+            **kwargs: Provider-specific parameters
+
+        Returns:
+            Same dictionary as query()
+        """
+        return await asyncio.to_thread(self.query, prompt, **kwargs)
+
+    def _wait_for_rate_limit(self):
+        """Block until the rpm limit allows another request."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+    async def _await_rate_limit(self):
+        """Async version of _wait_for_rate_limit()."""
+        if self.rate_limiter:
+            await asyncio.to_thread(self.rate_limiter.acquire)
+
+    def _retry_delay(
+        self, attempt: int, retry_after: Optional[str], waited: float, reason: str
+    ) -> Optional[float]:
+        """
+        Work out how long to wait before retrying a request.
+
+        Args:
+            attempt: Zero-based attempt number
+            retry_after: The response's Retry-After header, if any
+            waited: Seconds already spent waiting on earlier retries
+            reason: Why the request failed, for the log
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            # Exponential backoff with jitter so concurrent callers spread out
+            delay = self.backoff_base * 2**attempt + random.uniform(
+                0, self.backoff_base
+            )
+        delay = min(delay, RETRY_MAX_DELAY)
+        if waited + delay > RETRY_MAX_TOTAL_DELAY:
+            return None
+
+        logger.warning(
+            f"{self.provider_name} request {reason}, retrying in {delay:.1f}s "
+            f"(attempt {attempt + 1}/{self.max_retries})"
+        )
+        return delay
+
+    def _get_async_client(self):
+        """
+        Get the async HTTP client for the running event loop.
+
+        httpx async connection pools are tied to the loop that created them,
+        so each loop gets its own client from _create_async_client(). The
+        lock keeps threads running separate loops from racing on the map,
+        and clients of closed loops are dropped when a new one is made.
+        """
+        loop = asyncio.get_running_loop()
+        with self.async_clients_lock:
+            client = self.async_clients.get(loop)
+            if client is None:
+                for closed in [key for key in self.async_clients if key.is_closed()]:
+                    del self.async_clients[closed]
+                client = self.async_clients[loop] = self._create_async_client()
+        return client
+
+    def _create_async_client(self):
+        """Create an async HTTP client. Override in providers that use one."""
+        raise NotImplementedError(f"{self.provider_name} provider has no async client")
+
     @abstractmethod
     def validate_credentials(self) -> bool:
         """
@@ -75,6 +193,15 @@ class BaseLLMProvider(ABC):
         """Return the provider identifier (e.g., 'openai', 'perplexity')"""
         pass
 
+    def warmup(self):
+        """
+        Open a connection to the provider ahead of the first query.
+
+        Override in subclasses that keep a pooled HTTP client. Must not send
+        a billable request.
+        """
+        pass
+
     def estimate_cost(self, tokens_used: int, is_input: bool = False) -> float:
         """
         Estimate the cost of a query based on token usage.
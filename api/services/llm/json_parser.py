@@ -4,13 +4,21 @@ JSON parsing utilities with multiple strategies for handling LLM responses.
 Implements robust parsing to handle common LLM output variations.
 """
 
-import json
+import orjson
 import re
 import logging
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Markdown code blocks wrapping a JSON object, with and without a json tag
+MARKDOWN_JSON_RE = re.compile(r"```json\s*(\{.*?\})\s*```", re.DOTALL)
+MARKDOWN_BLOCK_RE = re.compile(r"```\s*(\{.*?\})\s*```", re.DOTALL)
+# Markdown fences (with or without a json tag) stripped by sanitize_json_string
+MARKDOWN_FENCE_RE = re.compile(r"```(?:json)?", re.IGNORECASE)
+# Characters that affect object nesting: escapes, string quotes and braces
+JSON_STRUCTURE_RE = re.compile(r'\\.|["{}]', re.DOTALL)
+
 
 class JSONParseError(Exception):
     """Exception raised when JSON parsing fails after all strategies"""
@@ -28,7 +36,7 @@ def parse_llm_json(
     1. Direct JSON parse (raw_response is pure JSON)
     2. Extract from markdown code blocks (```json ... ```)
     3. Extract from triple backticks without json tag (``` ... ```)
-    4. Find first { to last } (JSON embedded in text)
+    4. Find the first balanced {...} object (JSON embedded in text)
 
     Args:
         raw_response: The raw string response from LLM
@@ -40,55 +48,99 @@ def parse_llm_json(
     Raises:
         JSONParseError: If all parsing strategies fail
     """
-    if not raw_response or not raw_response.strip():
+    if not raw_response or raw_response.isspace():
         raise JSONParseError("Empty response from LLM")
 
-    # Strategy 1: Direct JSON parse
+    # Strategy 1: Direct JSON parse (orjson accepts surrounding whitespace)
     try:
-        result = json.loads(raw_response.strip())
+        result = orjson.loads(raw_response)
         return result, "direct"
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         if strict:
             raise JSONParseError(f"Direct JSON parse failed: {e}")
         logger.debug(f"Strategy 1 (direct parse) failed: {e}")
 
+    # Every fallback below extracts a {...} object, so without an opening
+    # brace there is nothing for them to find
+    start = raw_response.find("{")
+    if start == -1:
+        _raise_parse_failure(raw_response)
+
     # Strategy 2: Extract from markdown code block with json tag
     try:
-        pattern = r"```json\s*(\{.*?\})\s*```"
-        match = re.search(pattern, raw_response, re.DOTALL)
+        match = MARKDOWN_JSON_RE.search(raw_response)
         if match:
             json_str = match.group(1)
-            result = json.loads(json_str)
+            result = orjson.loads(json_str)
             logger.debug("Strategy 2 (markdown json block) succeeded")
             return result, "markdown_json"
-    except (json.JSONDecodeError, AttributeError) as e:
+    except (orjson.JSONDecodeError, AttributeError) as e:
         logger.debug(f"Strategy 2 (markdown json block) failed: {e}")
 
     # Strategy 3: Extract from any markdown code block
     try:
-        pattern = r"```\s*(\{.*?\})\s*```"
-        match = re.search(pattern, raw_response, re.DOTALL)
+        match = MARKDOWN_BLOCK_RE.search(raw_response)
         if match:
             json_str = match.group(1)
-            result = json.loads(json_str)
+            result = orjson.loads(json_str)
             logger.debug("Strategy 3 (markdown code block) succeeded")
             return result, "markdown_block"
-    except (json.JSONDecodeError, AttributeError) as e:
+    except (orjson.JSONDecodeError, AttributeError) as e:
         logger.debug(f"Strategy 3 (markdown code block) failed: {e}")
 
-    # Strategy 4: Find first { to last } (JSON embedded in text)
-    try:
-        start = raw_response.find("{")
-        end = raw_response.rfind("}")
-        if start != -1 and end != -1 and start < end:
-            json_str = raw_response[start : end + 1]
-            result = json.loads(json_str)
+    # Strategy 4: First balanced {...} object embedded in text. Objects that
+    # don't parse (e.g. braces in prose) are skipped in favour of the next one.
+    while start != -1:
+        end = _scan_json_object(raw_response, start)
+        if end == -1:
+            break
+        try:
+            result = orjson.loads(raw_response[start : end + 1])
             logger.debug("Strategy 4 (extract braces) succeeded")
             return result, "extract_braces"
-    except json.JSONDecodeError as e:
-        logger.debug(f"Strategy 4 (extract braces) failed: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.debug(f"Strategy 4 (extract braces) failed: {e}")
+        start = raw_response.find("{", end + 1)
 
     # All strategies failed
+    _raise_parse_failure(raw_response)
+
+
+def _scan_json_object(text: str, start: int) -> int:
+    """
+    Find the brace closing the JSON object that opens at text[start].
+
+    Tracks nesting depth and skips braces inside strings (honouring
+    backslash escapes), jumping between structural characters with a regex
+    rather than stepping through every character.
+
+    Args:
+        text: Text containing the object
+        start: Index of the opening brace
+
+    Returns:
+        Index of the matching closing brace, or -1 if the object is unbalanced
+    """
+    depth = 0
+    in_string = False
+    for match in JSON_STRUCTURE_RE.finditer(text, start):
+        token = match.group()
+        if token == '"':
+            in_string = not in_string
+        elif in_string or len(token) == 2:
+            # Escape sequence or brace inside a string
+            continue
+        elif token == "{":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return -1
+
+
+def _raise_parse_failure(raw_response: str):
+    """Raise the JSONParseError for a response no strategy could parse."""
     preview = raw_response[:200] + ("..." if len(raw_response) > 200 else "")
     raise JSONParseError(
         f"Failed to parse JSON from LLM response after all strategies. "
@@ -127,11 +179,8 @@ def sanitize_json_string(text: str) -> str:
     Returns:
         Sanitized text more likely to parse as JSON
     """
-    # Remove leading/trailing whitespace
-    text = text.strip()
-
-    # Remove common markdown artifacts
-    text = text.replace("```json", "").replace("```", "")
+    # Remove leading/trailing whitespace and common markdown artifacts in one pass
+    text = MARKDOWN_FENCE_RE.sub("", text.strip())
 
     # Remove newlines within strings (common LLM issue)
     # This is a simple approach - more sophisticated cleaning could be added
@@ -4,9 +4,18 @@ LLM Service orchestrator.
 Manages LLM providers, caching, and prompt rendering.
 """
 
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.db.models import Count, FloatField, IntegerField, Q, Sum
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast
 from django.utils import timezone
 from datetime import timedelta
 
@@ -14,12 +23,72 @@ from api.models import Product, LLMPrompt, LLMQueryResult
 from .base_provider import BaseLLMProvider
 from .openai_provider import OpenAIProvider
 from .perplexity_provider import PerplexityProvider
-from .exceptions import LLMProviderError
+from .exceptions import LLMInvalidResponseError, LLMProviderError
 from .schemas import get_schema, validate_response
 from .json_parser import create_error_response
 
 logger = logging.getLogger(__name__)
 
+# Appended to the prompt when retrying after an unparseable response
+RETRY_PROMPT_SUFFIX = (
+    "\n\nIMPORTANT: Your previous response had parsing errors. You MUST respond "
+    "with ONLY valid JSON. No markdown, no code blocks, no explanations. "
+    "Start with { and end with }."
+)
+
+# Process-local cache of active prompts: query_type -> (cached_at, LLMPrompt).
+# Prompts change rarely, so this saves a query per insight lookup. Entries are
+# cleared by the LLMPrompt save/delete signal handlers in api.signals.
+_active_prompt_cache: Dict[str, tuple[float, LLMPrompt]] = {}
+
+
+def clear_prompt_cache():
+    """Drop all cached active prompts (called when any LLMPrompt changes)."""
+    _active_prompt_cache.clear()
+
+
+# Providers shared by every LLMService in the process, so their HTTP
+# connection pools (and the TLS sessions in them) outlive a single request:
+# (provider_name, provider config items) -> provider
+_provider_cache: Dict[tuple, BaseLLMProvider] = {}
+_provider_cache_lock = threading.Lock()
+
+
+def clear_provider_cache():
+    """Drop all shared provider instances."""
+    with _provider_cache_lock:
+        _provider_cache.clear()
+
+
+# Process-local LRU in front of the LLMQueryResult table for hot products:
+# (product_id, prompt_id, provider) -> (cached_at, LLMQueryResult). Entries
+# live for LLMService.result_cache_ttl_seconds and are revalidated against
+# the row on every hit, so invalidations from other processes apply at once.
+RESULT_CACHE_MAXSIZE = 512
+_result_cache: "OrderedDict[tuple, tuple[float, LLMQueryResult]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def clear_result_cache(product_id: Optional[int] = None):
+    """
+    Drop cached results from the process-local LRU.
+
+    Args:
+        product_id: Only drop results for this product (default: all)
+    """
+    with _result_cache_lock:
+        if product_id is None:
+            _result_cache.clear()
+            return
+        for key in [key for key in _result_cache if key[0] == product_id]:
+            del _result_cache[key]
+
+
+# LLM queries awaited by aget_product_insight() that haven't finished yet:
+# (event loop, product_id, prompt_id, provider) -> task. Concurrent callers
+# asking for the same insight share the one in-flight request.
+_inflight_queries: Dict[tuple, asyncio.Task] = {}
+
 
 class LLMService:
     """
@@ -41,7 +110,28 @@ class LLMService:
         """
         self.config = settings.LLM_CONFIG
         self.default_provider_name = default_provider or self.config["default_provider"]
+        # Settings read on every lookup, resolved once per service
+        self.enable_caching = self.config["enable_caching"]
+        self.cache_ttl_days = self.config["cache_ttl_days"]
+        self.providers_config = self.config["providers"]
+        self.max_concurrent_queries = self.config.get("max_concurrent_queries", 8)
+        self.prompt_cache_ttl_seconds = self.config.get("prompt_cache_ttl_seconds", 60)
+        self.result_cache_ttl_seconds = self.config.get("result_cache_ttl_seconds", 60)
+        self.semantic_cache_threshold = self.config.get("semantic_cache_threshold", 0)
+        if not self.providers_config.get("openai", {}).get("api_key"):
+            # Embeddings come from the OpenAI API, so without a key every
+            # lookup would just fail
+            self.semantic_cache_threshold = 0
+        self.embedding_model = self.config.get(
+            "embedding_model", "text-embedding-3-small"
+        )
         self._providers: Dict[str, BaseLLMProvider] = {}
+        # Cache lookups batched by prefetch_cache():
+        # (product_id, prompt_id, provider) -> LLMQueryResult or None
+        self._prefetched: Dict[tuple, Optional[LLMQueryResult]] = {}
+        # Prompt embeddings computed by the semantic cache lookup, stored with
+        # the result once it arrives: query fingerprint -> embedding
+        self._embeddings: Dict[str, list[float]] = {}
 
         logger.info(
             f"LLMService initialized with default provider: {self.default_provider_name}"
@@ -76,66 +166,380 @@ class LLMService:
             LLMProviderError: If the LLM query fails after retries
         """
         provider_name = provider or self.default_provider_name
+        prompt_obj, rendered_prompt, cached = self._prepare_insight(
+            product, query_type, provider_name, force_refresh
+        )
+        if cached:
+            return cached
 
-        # Get the prompt template
-        prompt_obj = LLMPrompt.objects.filter(
-            query_type=query_type, is_active=True
-        ).first()
+        # Get provider and query with retry logic
+        llm_provider = self._get_provider(provider_name)
+        response, attempts = self._query_with_retry(
+            llm_provider=llm_provider,
+            prompt=rendered_prompt,
+            query_type=query_type,
+            max_retries=max_retries,
+        )
 
-        if not prompt_obj:
-            raise LLMPrompt.DoesNotExist(
-                f"No active prompt found for query_type '{query_type}'"
-            )
+        return self._store_response(
+            product, prompt_obj, provider_name, rendered_prompt, response, attempts
+        )
 
-        # Check cache unless force_refresh is True
-        if not force_refresh and self.config["enable_caching"]:
-            cached_result = self._check_cache(product, prompt_obj, provider_name)
-            if cached_result:
-                logger.info(
-                    f"Cache hit for product={product.id}, query_type={query_type}, "
-                    f"provider={provider_name}"
-                )
-                return {
-                    "content": cached_result.result,
-                    "cached": True,
-                    "result_obj": cached_result,
-                }
+    async def aget_product_insight(
+        self,
+        product: Product,
+        query_type: str,
+        provider: Optional[str] = None,
+        force_refresh: bool = False,
+        max_retries: int = 2,
+    ) -> Dict[str, Any]:
+        """
+        Async version of get_product_insight().
 
-        # Cache miss or force refresh - query LLM with retry logic
-        logger.info(
-            f"Cache miss for product={product.id}, query_type={query_type}, "
-            f"provider={provider_name}. Querying LLM..."
-        )
+        The LLM request is awaited through the provider's aquery(), so many
+        insights can be fetched concurrently on one event loop; cache lookups
+        and writes run through sync_to_async. Concurrent calls for the same
+        uncached insight share a single LLM request.
 
-        # Render prompt with product data
-        rendered_prompt = self._render_prompt(prompt_obj, product)
+        Args:
+            product: Product instance
+            query_type: Type of query (e.g., 'review_summary')
+            provider: LLM provider to use (defaults to self.default_provider_name)
+            force_refresh: Skip cache and query LLM directly
+            max_retries: Maximum number of retry attempts for failed parsing
 
-        # Get provider and query with retry logic
+        Returns:
+            Same dictionary as get_product_insight()
+
+        Raises:
+            LLMPrompt.DoesNotExist: If no active prompt exists for query_type
+        """
+        provider_name = provider or self.default_provider_name
+        prompt_obj, rendered_prompt, cached = await sync_to_async(
+            self._prepare_insight
+        )(product, query_type, provider_name, force_refresh)
+        if cached:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        key = (loop, product.id, prompt_obj.id, provider_name)
+        task = _inflight_queries.get(key)
+        if task is None:
+            task = loop.create_task(
+                self._aquery_and_store(
+                    product,
+                    prompt_obj,
+                    provider_name,
+                    rendered_prompt,
+                    query_type,
+                    max_retries,
+                )
+            )
+            _inflight_queries[key] = task
+            task.add_done_callback(lambda _: _inflight_queries.pop(key, None))
+
+        # Shielded so one caller being cancelled doesn't cancel the request
+        # for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    async def _aquery_and_store(
+        self,
+        product: Product,
+        prompt_obj: LLMPrompt,
+        provider_name: str,
+        rendered_prompt: str,
+        query_type: str,
+        max_retries: int,
+    ) -> Dict[str, Any]:
+        """Query the LLM for a cache miss and store the response."""
         llm_provider = self._get_provider(provider_name)
-        response, attempts = self._query_with_retry(
+        response, attempts = await self._aquery_with_retry(
             llm_provider=llm_provider,
             prompt=rendered_prompt,
             query_type=query_type,
             max_retries=max_retries,
         )
 
-        # Validate and store result
-        result_obj = self._store_result(
-            product=product,
-            prompt=prompt_obj,
-            provider=provider_name,
-            query_input=rendered_prompt,
-            result=response["content"],
-            metadata=response["metadata"],
-            schema_version=prompt_obj.schema_version,
-            parse_attempts=attempts,
+        return await sync_to_async(self._store_response)(
+            product, prompt_obj, provider_name, rendered_prompt, response, attempts
         )
 
-        return {
-            "content": response["content"],
-            "cached": False,
-            "result_obj": result_obj,
+    def get_product_insights_bulk(
+        self,
+        products: list[Product],
+        query_type: str,
+        provider: Optional[str] = None,
+        force_refresh: bool = False,
+        max_retries: int = 2,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get LLM-generated insights for many products at once.
+
+        Cache lookups happen in one query, and the LLM requests for cache
+        misses run concurrently (up to self.max_concurrent_queries) so
+        their network latency overlaps instead of adding up. Only the
+        provider calls run on worker threads; database work stays on the
+        calling thread.
+
+        Args:
+            products: Product instances
+            query_type: Type of query (e.g., 'review_summary')
+            provider: LLM provider to use (defaults to self.default_provider_name)
+            force_refresh: Skip cache and query LLM directly
+            max_retries: Maximum number of retry attempts for failed parsing
+
+        Returns:
+            Dictionary mapping product id to the same result dict that
+            get_product_insight() returns
+
+        Raises:
+            LLMPrompt.DoesNotExist: If no active prompt exists for query_type
+        """
+        provider_name = provider or self.default_provider_name
+        prompt_obj, results, misses, rendered = self._prepare_insights_bulk(
+            products, query_type, provider_name, force_refresh
+        )
+        if not misses:
+            return results
+
+        llm_provider = self._get_provider(provider_name)
+        workers = min(self.max_concurrent_queries, len(misses))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                product.id: executor.submit(
+                    self._query_with_retry,
+                    llm_provider=llm_provider,
+                    prompt=rendered[product.id],
+                    query_type=query_type,
+                    max_retries=max_retries,
+                )
+                for product in misses
+            }
+            # Store each response as it is consumed; _query_with_retry turns
+            # provider failures into error responses rather than raising
+            for product in misses:
+                response, attempts = futures[product.id].result()
+                results[product.id] = self._store_response(
+                    product,
+                    prompt_obj,
+                    provider_name,
+                    rendered[product.id],
+                    response,
+                    attempts,
+                )
+
+        return results
+
+    async def aget_product_insights_bulk(
+        self,
+        products: list[Product],
+        query_type: str,
+        provider: Optional[str] = None,
+        force_refresh: bool = False,
+        max_retries: int = 2,
+        concurrency: Optional[int] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Async version of get_product_insights_bulk().
+
+        Cache misses are queried with asyncio.gather, at most `concurrency`
+        at a time, through the provider's aquery().
+
+        Args:
+            products: Product instances
+            query_type: Type of query (e.g., 'review_summary')
+            provider: LLM provider to use (defaults to self.default_provider_name)
+            force_refresh: Skip cache and query LLM directly
+            max_retries: Maximum number of retry attempts for failed parsing
+            concurrency: Maximum concurrent LLM requests (defaults to
+                self.max_concurrent_queries)
+
+        Returns:
+            Dictionary mapping product id to the same result dict that
+            get_product_insight() returns, in the order of `products`
+
+        Raises:
+            LLMPrompt.DoesNotExist: If no active prompt exists for query_type
+        """
+        provider_name = provider or self.default_provider_name
+        prompt_obj, results, misses, rendered = await sync_to_async(
+            self._prepare_insights_bulk
+        )(products, query_type, provider_name, force_refresh)
+
+        if misses:
+            llm_provider = self._get_provider(provider_name)
+            semaphore = asyncio.Semaphore(concurrency or self.max_concurrent_queries)
+
+            async def query(product):
+                async with semaphore:
+                    return await self._aquery_with_retry(
+                        llm_provider=llm_provider,
+                        prompt=rendered[product.id],
+                        query_type=query_type,
+                        max_retries=max_retries,
+                    )
+
+            responses = await asyncio.gather(*(query(product) for product in misses))
+            store_response = sync_to_async(self._store_response)
+            for product, (response, attempts) in zip(misses, responses):
+                results[product.id] = await store_response(
+                    product,
+                    prompt_obj,
+                    provider_name,
+                    rendered[product.id],
+                    response,
+                    attempts,
+                )
+
+        return {product.id: results[product.id] for product in products}
+
+    def submit_batch_job(
+        self,
+        products: list[Product],
+        query_type: str,
+        provider: str = "openai",
+    ) -> str:
+        """
+        Submit insight queries for many products as a provider batch job.
+
+        For offline work (backfills, nightly refreshes) the OpenAI Batch API
+        is half the price of regular requests, in exchange for results
+        arriving within 24 hours. Collect them with poll_batch_job().
+
+        Args:
+            products: Product instances
+            query_type: Type of query (e.g., 'review_summary')
+            provider: LLM provider to use; must support batch jobs
+
+        Returns:
+            The provider batch ID, to be passed to poll_batch_job()
+
+        Raises:
+            LLMPrompt.DoesNotExist: If no active prompt exists for query_type
+            ValueError: If the provider doesn't support batch jobs
+        """
+        prompt_obj = self._get_active_prompt(query_type)
+        if not prompt_obj:
+            raise LLMPrompt.DoesNotExist(
+                f"No active prompt found for query_type '{query_type}'"
+            )
+
+        llm_provider = self._get_batch_provider(provider)
+        # custom_id carries the product and prompt so results can be stored
+        # without keeping any local state about the batch
+        prompts = {
+            f"{product.id}:{prompt_obj.id}": self._render_prompt(prompt_obj, product)
+            for product in products
         }
+        batch_id = llm_provider.submit_batch(
+            prompts,
+            response_schema=get_schema(query_type),
+            metadata={"query_type": query_type},
+        )
+
+        logger.info(
+            f"Submitted batch {batch_id} for {len(prompts)} product(s), "
+            f"query_type={query_type}, provider={provider}"
+        )
+        return batch_id
+
+    def poll_batch_job(
+        self, batch_id: str, provider: str = "openai"
+    ) -> Optional[Dict[int, Dict[str, Any]]]:
+        """
+        Check a batch job and cache its results once it has completed.
+
+        Args:
+            batch_id: ID returned by submit_batch_job()
+            provider: LLM provider the batch was submitted to
+
+        Returns:
+            None if the batch is still running, otherwise a dictionary
+            mapping product id to the same result dict that
+            get_product_insight() returns
+
+        Raises:
+            LLMProviderError: If the batch failed, expired or was cancelled
+            ValueError: If the provider doesn't support batch jobs
+        """
+        llm_provider = self._get_batch_provider(provider)
+        batch_results = llm_provider.get_batch_results(batch_id)
+        if batch_results is None:
+            return None
+
+        # Store the prompts exactly as submitted; re-rendering now would pick
+        # up any product or template edits made while the batch was running
+        sent_prompts = llm_provider.get_batch_prompts(batch_id)
+        keys = {
+            custom_id: tuple(int(part) for part in custom_id.split(":"))
+            for custom_id in batch_results
+        }
+        products = Product.objects.in_bulk({key[0] for key in keys.values()})
+        prompts = LLMPrompt.objects.in_bulk({key[1] for key in keys.values()})
+
+        results = {}
+        for custom_id, response in batch_results.items():
+            product_id, prompt_id = keys[custom_id]
+            product = products.get(product_id)
+            prompt_obj = prompts.get(prompt_id)
+            if product is None or prompt_obj is None:
+                logger.warning(
+                    f"Skipping batch {batch_id} result {custom_id}: "
+                    "product or prompt no longer exists"
+                )
+                continue
+
+            schema = get_schema(prompt_obj.query_type)
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                self._validate(response, schema, prompt_obj.query_type)
+            except (LLMProviderError, ValueError) as e:
+                logger.warning(f"Batch {batch_id} result {custom_id} failed: {e}")
+                response = self._retries_exhausted(e, 1, prompt_obj.query_type)
+
+            results[product_id] = self._store_response(
+                product,
+                prompt_obj,
+                provider,
+                sent_prompts.get(custom_id) or self._render_prompt(prompt_obj, product),
+                response,
+                attempts=1,
+            )
+
+        logger.info(f"Stored {len(results)} result(s) from batch {batch_id}")
+        return results
+
+    def prefetch_cache(
+        self,
+        products: list[Product],
+        query_type: str,
+        provider: Optional[str] = None,
+    ):
+        """
+        Load cached results for many products in a single query.
+
+        Subsequent get_product_insight() calls for these products use the
+        prefetched rows instead of querying the cache one product at a time.
+
+        Args:
+            products: Products that are about to be queried
+            query_type: Type of query (e.g., 'review_summary')
+            provider: LLM provider (defaults to self.default_provider_name)
+        """
+        if not products or not self.enable_caching:
+            return
+
+        prompt_obj = self._get_active_prompt(query_type)
+        if not prompt_obj:
+            return
+
+        provider_name = provider or self.default_provider_name
+        cached = self._check_cache_bulk(products, prompt_obj, provider_name)
+        for product in products:
+            self._prefetched[(product.id, prompt_obj.id, provider_name)] = cached.get(
+                product.id
+            )
 
     def invalidate_cache(
         self,
@@ -159,6 +563,8 @@ class LLMService:
             queryset = queryset.filter(provider=provider)
 
         count = queryset.update(is_stale=True)
+        self._prefetched.clear()
+        clear_result_cache(product.id)
         logger.info(f"Invalidated {count} cached result(s) for product {product.id}")
         return count
 
@@ -176,23 +582,225 @@ class LLMService:
         if product:
             queryset = queryset.filter(product=product)
 
-        total_cached = queryset.count()
-        fresh_cached = queryset.filter(is_stale=False).count()
-        stale_cached = queryset.filter(is_stale=True).count()
-
-        ttl_days = self.config["cache_ttl_days"]
+        ttl_days = self.cache_ttl_days
         cutoff_date = timezone.now() - timedelta(days=ttl_days)
-        old_cached = queryset.filter(created_at__lt=cutoff_date).count()
+
+        # One scan for all counts and usage totals instead of a query each,
+        # summing the provider metadata in the database rather than in Python
+        counts = queryset.aggregate(
+            total=Count("id"),
+            fresh=Count("id", filter=Q(is_stale=False)),
+            stale=Count("id", filter=Q(is_stale=True)),
+            old=Count("id", filter=Q(created_at__lt=cutoff_date)),
+            tokens_used=Sum(Cast(KT("metadata__tokens_used"), IntegerField())),
+            cost_estimate=Sum(Cast(KT("metadata__cost_estimate"), FloatField())),
+        )
 
         return {
-            "total_cached": total_cached,
-            "fresh": fresh_cached,
-            "stale": stale_cached,
-            "old": old_cached,
-            "cache_enabled": self.config["enable_caching"],
+            "total_cached": counts["total"],
+            "fresh": counts["fresh"],
+            "stale": counts["stale"],
+            "old": counts["old"],
+            "total_tokens_used": counts["tokens_used"] or 0,
+            "total_cost_estimate": counts["cost_estimate"] or 0.0,
+            "cache_enabled": self.enable_caching,
             "ttl_days": ttl_days,
         }
 
+    def _prepare_insight(
+        self,
+        product: Product,
+        query_type: str,
+        provider_name: str,
+        force_refresh: bool,
+    ) -> tuple[LLMPrompt, Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Resolve the prompt and check the cache ahead of an LLM query.
+
+        Args:
+            product: Product instance
+            query_type: Type of query (e.g., 'review_summary')
+            provider_name: Provider name
+            force_refresh: Skip the cache
+
+        Returns:
+            Tuple of (prompt, rendered prompt, cached result dict). On a cache
+            hit the rendered prompt is None; on a miss the result dict is None.
+
+        Raises:
+            LLMPrompt.DoesNotExist: If no active prompt exists for query_type
+        """
+        # Get the prompt template
+        prompt_obj = self._get_active_prompt(query_type)
+
+        if not prompt_obj:
+            raise LLMPrompt.DoesNotExist(
+                f"No active prompt found for query_type '{query_type}'"
+            )
+
+        # Check cache unless force_refresh is True
+        if not force_refresh and self.enable_caching:
+            cached_result = self._check_cache(product, prompt_obj, provider_name)
+            if cached_result:
+                logger.info(
+                    f"Cache hit for product={product.id}, query_type={query_type}, "
+                    f"provider={provider_name}"
+                )
+                return (
+                    prompt_obj,
+                    None,
+                    {
+                        "content": cached_result.result,
+                        "cached": True,
+                        "result_obj": cached_result,
+                    },
+                )
+
+        # Cache miss or force refresh
+        logger.info(
+            f"Cache miss for product={product.id}, query_type={query_type}, "
+            f"provider={provider_name}. Querying LLM..."
+        )
+
+        # Render prompt with product data
+        rendered_prompt = self._render_prompt(prompt_obj, product)
+
+        # An equivalent prompt (e.g. a reworded-by-whitespace template) may
+        # already have a result for this product
+        if not force_refresh and self.enable_caching:
+            cached_result = self._check_cache_by_fingerprint(
+                {product.id: rendered_prompt}, provider_name
+            ).get(product.id)
+            if cached_result:
+                self._remember_result(
+                    (product.id, prompt_obj.id, provider_name), cached_result
+                )
+                return (
+                    prompt_obj,
+                    None,
+                    {
+                        "content": cached_result.result,
+                        "cached": True,
+                        "result_obj": cached_result,
+                    },
+                )
+
+            # Or a reworded prompt may mean the same thing
+            cached_result = self._check_semantic_cache(
+                product, prompt_obj, provider_name, rendered_prompt
+            )
+            if cached_result:
+                self._remember_result(
+                    (product.id, prompt_obj.id, provider_name), cached_result
+                )
+                return (
+                    prompt_obj,
+                    None,
+                    {
+                        "content": cached_result.result,
+                        "cached": True,
+                        "result_obj": cached_result,
+                    },
+                )
+
+        return prompt_obj, rendered_prompt, None
+
+    def _prepare_insights_bulk(
+        self,
+        products: list[Product],
+        query_type: str,
+        provider_name: str,
+        force_refresh: bool,
+    ) -> tuple[LLMPrompt, Dict[int, Dict[str, Any]], list[Product], Dict[int, str]]:
+        """
+        Resolve the prompt and serve cache hits for a bulk insight lookup.
+
+        Args:
+            products: Product instances
+            query_type: Type of query (e.g., 'review_summary')
+            provider_name: Provider name
+            force_refresh: Skip the cache
+
+        Returns:
+            Tuple of (prompt, result dicts for cache hits keyed by product id,
+            distinct products that still need an LLM query, their rendered
+            prompts)
+
+        Raises:
+            LLMPrompt.DoesNotExist: If no active prompt exists for query_type
+        """
+        prompt_obj = self._get_active_prompt(query_type)
+        if not prompt_obj:
+            raise LLMPrompt.DoesNotExist(
+                f"No active prompt found for query_type '{query_type}'"
+            )
+
+        # Query each product once even if it is listed more than once;
+        # results are keyed by product id, so duplicates share the entry
+        products = list({product.id: product for product in products}.values())
+
+        results = {}
+        misses = []
+        cached = {}
+        if not force_refresh and self.enable_caching:
+            cached = self._check_cache_bulk(products, prompt_obj, provider_name)
+        for product in products:
+            cached_result = cached.get(product.id)
+            if cached_result:
+                results[product.id] = {
+                    "content": cached_result.result,
+                    "cached": True,
+                    "result_obj": cached_result,
+                }
+            else:
+                misses.append(product)
+
+        if not misses:
+            return prompt_obj, results, misses, {}
+
+        logger.info(
+            f"Bulk insight: {len(results)} cache hit(s), querying "
+            f"{len(misses)} product(s) for query_type={query_type}, "
+            f"provider={provider_name}"
+        )
+        rendered = {
+            product.id: self._render_prompt(prompt_obj, product) for product in misses
+        }
+        if not force_refresh and self.enable_caching:
+            for product_id, cached_result in self._check_cache_by_fingerprint(
+                rendered, provider_name
+            ).items():
+                results[product_id] = {
+                    "content": cached_result.result,
+                    "cached": True,
+                    "result_obj": cached_result,
+                }
+            misses = [product for product in misses if product.id not in results]
+
+        return prompt_obj, results, misses, rendered
+
+    def _get_active_prompt(self, query_type: str) -> Optional[LLMPrompt]:
+        """
+        Get the active prompt for a query type, using the process-local cache.
+
+        Args:
+            query_type: Type of query (e.g., 'review_summary')
+
+        Returns:
+            The active LLMPrompt, or None if there is none
+        """
+        ttl_seconds = self.prompt_cache_ttl_seconds
+        cached = _active_prompt_cache.get(query_type)
+        if cached and time.monotonic() - cached[0] < ttl_seconds:
+            return cached[1]
+
+        prompt_obj = LLMPrompt.objects.filter(
+            query_type=query_type, is_active=True
+        ).first()
+        if prompt_obj:
+            _active_prompt_cache[query_type] = (time.monotonic(), prompt_obj)
+        return prompt_obj
+
     def _check_cache(
         self, product: Product, prompt: LLMPrompt, provider: str
     ) -> Optional[LLMQueryResult]:
@@ -208,12 +816,21 @@ class LLMService:
             LLMQueryResult if found and fresh, None otherwise
         """
         try:
-            cached = LLMQueryResult.objects.get(
-                product=product, prompt=prompt, provider=provider
-            )
+            key = (product.id, prompt.id, provider)
+            if key in self._prefetched:
+                cached = self._prefetched.pop(key)
+                if cached is None:
+                    return None
+            else:
+                cached = self._get_recent_result(key)
+                if cached is None:
+                    cached = LLMQueryResult.objects.without_large_fields().get(
+                        product=product, prompt=prompt, provider=provider
+                    )
 
-            ttl_days = self.config["cache_ttl_days"]
+            ttl_days = self.cache_ttl_days
             if cached.is_fresh(ttl_days=ttl_days):
+                self._remember_result(key, cached)
                 return cached
             else:
                 logger.debug(
@@ -224,6 +841,187 @@ class LLMService:
         except LLMQueryResult.DoesNotExist:
             return None
 
+    def _check_cache_bulk(
+        self, products: list[Product], prompt: LLMPrompt, provider: str
+    ) -> Dict[int, LLMQueryResult]:
+        """
+        Look up fresh cached results for many products in one query.
+
+        Args:
+            products: Product instances
+            prompt: LLMPrompt instance
+            provider: Provider name
+
+        Returns:
+            Dictionary mapping product id to its fresh LLMQueryResult; products
+            without a fresh result are absent
+        """
+        results = (
+            LLMQueryResult.objects.without_large_fields()
+            .filter(product__in=products, prompt=prompt, provider=provider)
+            .fresh(ttl_days=self.cache_ttl_days)
+        )
+        return {result.product_id: result for result in results}
+
+    def _check_cache_by_fingerprint(
+        self, rendered: Dict[int, str], provider: str
+    ) -> Dict[int, LLMQueryResult]:
+        """
+        Look up fresh results stored under any prompt that rendered to an
+        equivalent query (same text ignoring case and whitespace).
+
+        Args:
+            rendered: Mapping of product id -> rendered prompt
+            provider: Provider name
+
+        Returns:
+            Dictionary mapping product id to a matching fresh LLMQueryResult
+        """
+        fingerprints = {
+            product_id: LLMQueryResult.make_fingerprint(prompt)
+            for product_id, prompt in rendered.items()
+        }
+        candidates = (
+            LLMQueryResult.objects.without_large_fields()
+            .filter(
+                product_id__in=fingerprints,
+                provider=provider,
+                query_fingerprint__in=set(fingerprints.values()),
+            )
+            .fresh(ttl_days=self.cache_ttl_days)
+        )
+        return {
+            result.product_id: result
+            for result in candidates
+            if fingerprints[result.product_id] == result.query_fingerprint
+        }
+
+    def _check_semantic_cache(
+        self,
+        product: Product,
+        prompt: LLMPrompt,
+        provider: str,
+        rendered_prompt: str,
+    ) -> Optional[LLMQueryResult]:
+        """
+        Look up a fresh result for this product whose prompt embedding is
+        close to the rendered prompt's (e.g. after a prompt template rewording).
+
+        Only the product's own results for the same query type are compared:
+        prompts for different products differ mostly in the product name, so
+        they embed too closely to tell apart.
+
+        Each lookup costs one OpenAI embeddings request, whichever provider
+        answers the query; it only runs on a cache miss and when OpenAI is
+        configured.
+
+        Args:
+            product: Product instance
+            prompt: LLMPrompt instance
+            provider: Provider name
+            rendered_prompt: The prompt that would be sent
+
+        Returns:
+            The most similar LLMQueryResult at or above
+            self.semantic_cache_threshold, or None
+        """
+        if not self.semantic_cache_threshold:
+            return None
+        embedding = self._embed(rendered_prompt)
+        if embedding is None:
+            return None
+
+        candidates = (
+            LLMQueryResult.objects.filter(
+                product=product,
+                provider=provider,
+                prompt__query_type=prompt.query_type,
+                query_embedding__isnull=False,
+            )
+            .fresh(ttl_days=self.cache_ttl_days)
+            .only("id", "query_embedding")
+        )
+        best_id = None
+        best_score = self.semantic_cache_threshold
+        for candidate in candidates:
+            # Embeddings are unit length, so the dot product is the cosine
+            score = sum(a * b for a, b in zip(embedding, candidate.query_embedding))
+            if score >= best_score:
+                best_id, best_score = candidate.id, score
+        if best_id is None:
+            return None
+
+        logger.info(
+            f"Semantic cache hit for product={product.id}, "
+            f"query_type={prompt.query_type}, similarity={best_score:.3f}"
+        )
+        return LLMQueryResult.objects.without_large_fields().get(id=best_id)
+
+    def _embed(self, text: str) -> Optional[list[float]]:
+        """
+        Embed a rendered prompt for the semantic cache and keep the vector so
+        _store_result can save it with the result.
+
+        Returns:
+            The embedding, or None if it couldn't be computed
+        """
+        try:
+            embedding = self._get_provider("openai").embed(
+                text, model=self.embedding_model
+            )
+        except (LLMProviderError, ValueError) as e:
+            logger.warning(f"Skipping semantic cache lookup: {e}")
+            return None
+        self._embeddings[LLMQueryResult.make_fingerprint(text)] = embedding
+        return embedding
+
+    def _get_recent_result(self, key: tuple) -> Optional[LLMQueryResult]:
+        """
+        Look up a result in the process-local LRU.
+
+        Args:
+            key: (product_id, prompt_id, provider)
+
+        Returns:
+            The cached LLMQueryResult, or None if absent, expired or changed
+            in the database since it was cached
+        """
+        ttl_seconds = self.result_cache_ttl_seconds
+        with _result_cache_lock:
+            entry = _result_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= ttl_seconds:
+                del _result_cache[key]
+                return None
+            _result_cache.move_to_end(key)
+            result = entry[1]
+
+        # Other workers (e.g. the admin's "mark as stale") can't reach this
+        # process's LRU, so check the row is unchanged; two small columns by
+        # primary key instead of the whole result
+        current = (
+            LLMQueryResult.objects.filter(pk=result.pk)
+            .values_list("is_stale", "updated_at")
+            .first()
+        )
+        if current != (False, result.updated_at):
+            with _result_cache_lock:
+                _result_cache.pop(key, None)
+            return None
+        return result
+
+    def _remember_result(self, key: tuple, result: LLMQueryResult):
+        """Add a fresh result to the process-local LRU."""
+        if self.result_cache_ttl_seconds <= 0:
+            return
+        with _result_cache_lock:
+            if key not in _result_cache:
+                _result_cache[key] = (time.monotonic(), result)
+            _result_cache.move_to_end(key)
+            while len(_result_cache) > RESULT_CACHE_MAXSIZE:
+                _result_cache.popitem(last=False)
+
     def _query_with_retry(
         self,
         llm_provider: BaseLLMProvider,
@@ -247,49 +1045,108 @@ class LLMService:
             LLMProviderError: If all attempts fail
         """
         schema = get_schema(query_type)
-        last_error = None
 
         for attempt in range(1, max_retries + 1):
             try:
                 # Add stronger JSON instructions on retries
                 if attempt > 1:
-                    retry_prompt = f"{prompt}\n\nIMPORTANT: Your previous response had parsing errors. You MUST respond with ONLY valid JSON. No markdown, no code blocks, no explanations. Start with {{ and end with }}."
-                    response = llm_provider.query(retry_prompt)
-                else:
-                    response = llm_provider.query(prompt)
-
-                # Validate against schema if available
-                if schema and isinstance(response["content"], dict):
-                    validated_content = validate_response(response["content"], schema)
-                    response["content"] = validated_content
-                    logger.info(
-                        f"Successfully validated response against {query_type} schema"
+                    response = llm_provider.query(
+                        prompt + RETRY_PROMPT_SUFFIX, response_schema=schema
                     )
+                else:
+                    response = llm_provider.query(prompt, response_schema=schema)
 
+                response = self._validate(response, schema, query_type)
                 logger.info(f"LLM query succeeded on attempt {attempt}")
                 return response, attempt
 
             except (LLMProviderError, ValueError) as e:
-                last_error = e
                 logger.warning(f"Attempt {attempt}/{max_retries} failed: {e}")
+                if attempt >= max_retries or not self._should_retry(e):
+                    return self._retries_exhausted(e, attempt, query_type), attempt
 
-                if attempt >= max_retries:
-                    # All retries exhausted - create error response
-                    logger.error(
-                        f"All {max_retries} attempts failed for query_type={query_type}"
-                    )
-                    error_response = create_error_response(
-                        error_message=str(last_error), raw_response=None
+        # Only reachable with max_retries < 1
+        raise LLMProviderError(f"Query failed after {max_retries} attempts")
+
+    async def _aquery_with_retry(
+        self,
+        llm_provider: BaseLLMProvider,
+        prompt: str,
+        query_type: str,
+        max_retries: int = 2,
+    ) -> tuple[Dict[str, Any], int]:
+        """
+        Async version of _query_with_retry(), awaiting llm_provider.aquery().
+
+        Args:
+            llm_provider: The LLM provider instance
+            prompt: The rendered prompt
+            query_type: Type of query for schema validation
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Tuple of (response dict, attempt count)
+
+        Raises:
+            LLMProviderError: If all attempts fail
+        """
+        schema = get_schema(query_type)
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                if attempt > 1:
+                    response = await llm_provider.aquery(
+                        prompt + RETRY_PROMPT_SUFFIX, response_schema=schema
                     )
-                    return {
-                        "content": error_response,
-                        "metadata": {"error": str(last_error), "attempts": attempt},
-                    }, attempt
-
-        # Should never reach here, but just in case
-        raise LLMProviderError(
-            f"Query failed after {max_retries} attempts: {last_error}"
-        )
+                else:
+                    response = await llm_provider.aquery(prompt, response_schema=schema)
+
+                response = self._validate(response, schema, query_type)
+                logger.info(f"LLM query succeeded on attempt {attempt}")
+                return response, attempt
+
+            except (LLMProviderError, ValueError) as e:
+                logger.warning(f"Attempt {attempt}/{max_retries} failed: {e}")
+                if attempt >= max_retries or not self._should_retry(e):
+                    return self._retries_exhausted(e, attempt, query_type), attempt
+
+        raise LLMProviderError(f"Query failed after {max_retries} attempts")
+
+    def _should_retry(self, error: Exception) -> bool:
+        """
+        Whether a failed attempt is worth repeating with the JSON reminder.
+
+        Only unusable output is: providers already retry rate limits and
+        failed connections themselves (within the worker timeout), and a
+        timed-out request may have been processed and billed.
+        """
+        return isinstance(error, (LLMInvalidResponseError, ValueError))
+
+    def _validate(
+        self, response: Dict[str, Any], schema, query_type: str
+    ) -> Dict[str, Any]:
+        """
+        Validate a provider response's content against the query type's schema.
+
+        Raises:
+            ValueError: If required fields are missing or invalid
+        """
+        if schema and isinstance(response["content"], dict):
+            response["content"] = validate_response(response["content"], schema)
+            logger.info(f"Successfully validated response against {query_type} schema")
+        return response
+
+    def _retries_exhausted(
+        self, error: Exception, attempt: int, query_type: str
+    ) -> Dict[str, Any]:
+        """Build the error response stored when every attempt has failed."""
+        logger.error(f"All {attempt} attempts failed for query_type={query_type}")
+        return {
+            "content": create_error_response(
+                error_message=str(error), raw_response=None
+            ),
+            "metadata": {"error": str(error), "attempts": attempt},
+        }
 
     def _store_result(
         self,
@@ -317,31 +1174,95 @@ class LLMService:
         """
         # Extract parse strategy from metadata
         parse_strategy = metadata.get("parse_strategy")
+        fingerprint = LLMQueryResult.make_fingerprint(query_input)
 
-        # Update or create cache entry
-        cached, created = LLMQueryResult.objects.update_or_create(
+        # Upsert the cache entry in a single INSERT ... ON CONFLICT DO UPDATE
+        # rather than update_or_create's SELECT FOR UPDATE + write. created_at
+        # is refreshed too, since it is when the cached insight was generated
+        # and drives the TTL check in is_fresh().
+        cached = LLMQueryResult(
             product=product,
             prompt=prompt,
             provider=provider,
-            defaults={
-                "query_input": query_input,
-                "result": result,
-                "metadata": metadata,
-                "schema_version": schema_version,
-                "parse_attempts": parse_attempts,
-                "parse_strategy": parse_strategy,
-                "is_stale": False,
-            },
+            query_input=query_input,
+            query_fingerprint=fingerprint,
+            query_embedding=self._embeddings.pop(fingerprint, None),
+            result=result,
+            metadata=metadata,
+            schema_version=schema_version,
+            parse_attempts=parse_attempts,
+            parse_strategy=parse_strategy,
+            is_stale=False,
         )
+        LLMQueryResult.objects.bulk_create(
+            [cached],
+            update_conflicts=True,
+            unique_fields=["product", "prompt", "provider"],
+            update_fields=[
+                "query_input",
+                "query_fingerprint",
+                "query_embedding",
+                "result",
+                "metadata",
+                "schema_version",
+                "parse_attempts",
+                "parse_strategy",
+                "is_stale",
+                "created_at",
+                "updated_at",
+            ],
+        )
+
+        with _result_cache_lock:
+            _result_cache.pop((product.id, prompt.id, provider), None)
 
-        action = "Created" if created else "Updated"
         logger.info(
-            f"{action} cached result for product={product.id}, "
+            f"Stored cached result for product={product.id}, "
             f"prompt={prompt.name}, provider={provider}, attempts={parse_attempts}"
         )
 
         return cached
 
+    def _store_response(
+        self,
+        product: Product,
+        prompt: LLMPrompt,
+        provider: str,
+        query_input: str,
+        response: Dict[str, Any],
+        attempts: int,
+    ) -> Dict[str, Any]:
+        """
+        Cache a fresh LLM response and wrap it like get_product_insight() does.
+
+        Args:
+            product: Product instance
+            prompt: LLMPrompt instance
+            provider: Provider name
+            query_input: The rendered prompt sent
+            response: Provider response with 'content' and 'metadata'
+            attempts: Number of attempts the query took
+
+        Returns:
+            Dictionary with content, cached=False and result_obj
+        """
+        result_obj = self._store_result(
+            product=product,
+            prompt=prompt,
+            provider=provider,
+            query_input=query_input,
+            result=response["content"],
+            metadata=response["metadata"],
+            schema_version=prompt.schema_version,
+            parse_attempts=attempts,
+        )
+
+        return {
+            "content": response["content"],
+            "cached": False,
+            "result_obj": result_obj,
+        }
+
     def _render_prompt(self, prompt: LLMPrompt, product: Product) -> str:
         """
         Render prompt template with product data.
@@ -377,13 +1298,13 @@ class LLMService:
             return self._providers[provider_name]
 
         # Create new provider instance
-        if provider_name not in self.config["providers"]:
+        if provider_name not in self.providers_config:
             raise ValueError(
                 f"Unknown provider '{provider_name}'. "
-                f"Available: {list(self.config['providers'].keys())}"
+                f"Available: {list(self.providers_config)}"
             )
 
-        provider_config = self.config["providers"][provider_name]
+        provider_config = self.providers_config[provider_name]
 
         if not provider_config.get("api_key"):
             raise ValueError(
@@ -391,20 +1312,39 @@ class LLMService:
                 f"Set {provider_name.upper()}_API_KEY environment variable."
             )
 
-        # Instantiate provider
-        if provider_name == "openai":
-            provider = OpenAIProvider(**provider_config)
-        elif provider_name == "perplexity":
-            provider = PerplexityProvider(**provider_config)
-        else:
-            raise ValueError(f"Provider '{provider_name}' is not implemented yet")
+        key = (provider_name, tuple(sorted(provider_config.items())))
+        with _provider_cache_lock:
+            provider = _provider_cache.get(key)
+            if provider is None:
+                # Instantiate provider
+                if provider_name == "openai":
+                    provider = OpenAIProvider(**provider_config)
+                elif provider_name == "perplexity":
+                    provider = PerplexityProvider(**provider_config)
+                else:
+                    raise ValueError(
+                        f"Provider '{provider_name}' is not implemented yet"
+                    )
+                _provider_cache[key] = provider
+                logger.info(f"Initialized {provider_name} provider")
 
         # Cache the provider instance
         self._providers[provider_name] = provider
-        logger.info(f"Initialized {provider_name} provider")
 
         return provider
 
+    def _get_batch_provider(self, provider_name: str) -> BaseLLMProvider:
+        """
+        Get a provider instance that supports batch jobs.
+
+        Raises:
+            ValueError: If the provider doesn't support batch jobs
+        """
+        llm_provider = self._get_provider(provider_name)
+        if not hasattr(llm_provider, "submit_batch"):
+            raise ValueError(f"Provider '{provider_name}' does not support batch jobs")
+        return llm_provider
+
     def list_available_providers(self) -> list[str]:
         """
         List all configured providers.
@@ -412,7 +1352,32 @@ class LLMService:
         Returns:
             List of provider names
         """
-        return list(self.config["providers"].keys())
+        return list(self.providers_config.keys())
+
+    def warmup(self, providers: Optional[list[str]] = None) -> list[str]:
+        """
+        Create providers and open a connection to each one.
+
+        Providers are shared across the process, so doing this at startup
+        moves client construction and the TLS handshake off the first user
+        request. Providers without an API key are skipped.
+
+        Args:
+            providers: Provider names to warm (default: all configured)
+
+        Returns:
+            Names of the providers that were warmed up
+        """
+        warmed = []
+        for provider_name in providers or self.list_available_providers():
+            if not self.providers_config.get(provider_name, {}).get("api_key"):
+                continue
+            try:
+                self._get_provider(provider_name).warmup()
+                warmed.append(provider_name)
+            except Exception as e:
+                logger.warning(f"Warm-up failed for provider '{provider_name}': {e}")
+        return warmed
 
     def validate_provider(self, provider_name: str) -> bool:
         """
@@ -4,19 +4,19 @@ OpenAI provider implementation.
 Uses the official OpenAI Python SDK for ChatGPT queries.
 """
 
+import asyncio
+import httpx
 import logging
-from typing import Dict, Any
-from openai import (
-    OpenAI,
-    APIError,
-    AuthenticationError,
-    RateLimitError,
-    APITimeoutError,
-)
-from .base_provider import BaseLLMProvider
+import orjson
+import time
+from contextlib import contextmanager
+from functools import cache
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional
+from .base_provider import BaseLLMProvider, RETRYABLE_CONNECT_ERRORS
 from .pricing import OpenAIPricing
 from .json_parser import parse_llm_json, JSONParseError
 from .exceptions import (
+    LLMProviderError,
     LLMAuthenticationError,
     LLMRateLimitError,
     LLMInvalidResponseError,
@@ -24,14 +24,55 @@ from .exceptions import (
     LLMNetworkError,
 )
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+    from openai.types.chat import ChatCompletion
+
 logger = logging.getLogger(__name__)
 
+BATCH_ENDPOINT = "/v1/chat/completions"
+# Batch API requests are billed at 50% of the synchronous price
+BATCH_COST_MULTIPLIER = 0.5
+BATCH_PENDING_STATUSES = ("validating", "in_progress", "finalizing", "cancelling")
+
+# Sent first in every request; built once and shared (never mutated)
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a JSON API that provides accurate, structured information about products. Always respond with valid JSON only.",
+}
+
+
+@cache
+def _openai():
+    """
+    Import the OpenAI SDK on first use.
+
+    The SDK takes around half a second to import, and this module is loaded
+    by every process that loads the api app (including each manage.py
+    command) whether or not it ever talks to OpenAI.
+    """
+    import openai
+
+    return openai
+
 
 class OpenAIProvider(BaseLLMProvider):
     """
     OpenAI ChatGPT provider implementation using the official SDK.
     """
 
+    __slots__ = (
+        "model",
+        "max_tokens",
+        "temperature",
+        "timeout",
+        "enable_json_mode",
+        "structured_outputs",
+        "max_connections",
+        "stream",
+        "client",
+    )
+
     def __init__(self, api_key: str, **kwargs):
         super().__init__(api_key, **kwargs)
         self.model = kwargs.get("model", "gpt-5-nano")
@@ -39,11 +80,26 @@ class OpenAIProvider(BaseLLMProvider):
         self.temperature = kwargs.get("temperature", 0.5)
         self.timeout = kwargs.get("timeout", 30.0)
         self.enable_json_mode = kwargs.get("enable_json_mode", True)
+        # json_schema response formats need a model with Structured Outputs
+        # (gpt-4o-2024-08-06 or later); older ones reject them with a 400
+        self.structured_outputs = kwargs.get("structured_outputs", False)
+        self.max_connections = kwargs.get("max_connections", 20)
+        self.stream = kwargs.get("stream", False)
 
-        # Initialize OpenAI client
-        self.client = OpenAI(
+        # Initialize OpenAI client with a connection pool sized for
+        # concurrent queries (e.g. LLMService.get_product_insights_bulk)
+        sdk = _openai()
+        self.client = sdk.OpenAI(
             api_key=self.api_key,
             timeout=self.timeout,
+            # Retried by _call()/_acreate() instead; see there
+            max_retries=0,
+            http_client=sdk.DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                )
+            ),
         )
 
     @property
@@ -56,62 +112,303 @@ class OpenAIProvider(BaseLLMProvider):
 
         Args:
             prompt: The prompt text
-            **kwargs: Optional overrides for model, max_tokens, temperature, parse_json
+            **kwargs: Optional overrides for model, max_tokens, temperature,
+                parse_json, stream
 
         Returns:
             Dict with 'content' (parsed JSON dict if parse_json=True, else string) and 'metadata' keys
         """
-        model = kwargs.get("model", self.model)
-        max_tokens = kwargs.get("max_tokens", self.max_tokens)
-        temperature = kwargs.get("temperature", self.temperature)
-        parse_json = kwargs.get("parse_json", True)  # Default to parsing JSON
-        enable_json_mode = kwargs.get("enable_json_mode", self.enable_json_mode)
+        request_params, parse_json, enable_json_mode = self._build_request(
+            prompt, **kwargs
+        )
+        stream = kwargs.get("stream", self.stream)
 
         logger.debug(
-            f"Querying OpenAI with model={model}, max_tokens={max_tokens}, json_mode={enable_json_mode}"
+            f"Querying OpenAI with model={request_params['model']}, "
+            f"max_tokens={request_params['max_tokens']}, json_mode={enable_json_mode}"
         )
 
-        # Build request parameters
-        request_params = {
-            "model": model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a JSON API that provides accurate, structured information about products. Always respond with valid JSON only.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "top_p": 0.9,
-        }
+        with self._translate_errors():
+            if stream:
+                strict_json = enable_json_mode and parse_json
+                response = self._call(
+                    lambda: self._create_streamed(request_params, strict_json)
+                )
+            else:
+                response = self._call(
+                    lambda: self.client.chat.completions.create(**request_params)
+                )
 
-        # Enable JSON mode if requested and supported
-        if enable_json_mode and parse_json:
-            request_params["response_format"] = {"type": "json_object"}
+        return self._parse_response(
+            response, request_params["model"], parse_json, enable_json_mode
+        )
 
-        try:
-            response = self.client.chat.completions.create(**request_params)
+    async def aquery(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """
+        Query OpenAI without blocking the event loop.
+
+        Args:
+            prompt: The prompt text
+            **kwargs: Same overrides as query() (stream is not supported)
+
+        Returns:
+            Dict with 'content' and 'metadata' keys, as query() returns
+        """
+        request_params, parse_json, enable_json_mode = self._build_request(
+            prompt, **kwargs
+        )
+
+        with self._translate_errors():
+            response = await self._acreate(request_params)
+
+        return self._parse_response(
+            response, request_params["model"], parse_json, enable_json_mode
+        )
+
+    def _call(self, request: Callable[[], Any]) -> Any:
+        """
+        Make an API request, retrying rate limits and failed connections with
+        backoff. Every attempt waits for the rpm limit.
 
-        except AuthenticationError as e:
+        The SDK's own retries are off: they would bypass the rpm limit, wait
+        as long as Retry-After asks and resend requests that timed out while
+        reading, which OpenAI may still process (and bill).
+        """
+        sdk = _openai()
+        waited = 0.0
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit()
+            try:
+                return request()
+            except (sdk.RateLimitError, sdk.APIConnectionError) as e:
+                delay = self._error_retry_delay(e, attempt, waited)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            waited += delay
+
+    async def _acreate(self, request_params: Dict[str, Any]) -> "ChatCompletion":
+        """Create a chat completion like _call(), without blocking the loop."""
+        sdk = _openai()
+        waited = 0.0
+        for attempt in range(self.max_retries + 1):
+            await self._await_rate_limit()
+            try:
+                return await self._get_async_client().chat.completions.create(
+                    **request_params
+                )
+            except (sdk.RateLimitError, sdk.APIConnectionError) as e:
+                delay = self._error_retry_delay(e, attempt, waited)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def _error_retry_delay(
+        self, error: Exception, attempt: int, waited: float
+    ) -> Optional[float]:
+        """Seconds to wait before retrying after an SDK error, or None."""
+        if isinstance(error, _openai().RateLimitError):
+            retry_after = error.response.headers.get("retry-after")
+            return self._retry_delay(attempt, retry_after, waited, "rate limited")
+        if isinstance(error.__cause__, RETRYABLE_CONNECT_ERRORS):
+            return self._retry_delay(attempt, None, waited, "could not connect")
+        return None
+
+    def _create_async_client(self) -> "AsyncOpenAI":
+        """Create an AsyncOpenAI client; see BaseLLMProvider._get_async_client()."""
+        sdk = _openai()
+        return sdk.AsyncOpenAI(
+            api_key=self.api_key,
+            timeout=self.timeout,
+            # Retried by _call()/_acreate() instead; see there
+            max_retries=0,
+            http_client=sdk.DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                )
+            ),
+        )
+
+    @contextmanager
+    def _translate_errors(self):
+        """Map OpenAI SDK exceptions to LLMProviderError subclasses."""
+        sdk = _openai()
+        try:
+            yield
+        except LLMProviderError:
+            raise
+        except sdk.AuthenticationError as e:
             raise LLMAuthenticationError(
                 "OpenAI authentication failed. Check your API key."
             ) from e
-        except RateLimitError as e:
+        except sdk.RateLimitError as e:
             raise LLMRateLimitError(
                 "OpenAI rate limit exceeded. Please try again later."
             ) from e
-        except APITimeoutError as e:
+        except sdk.APITimeoutError as e:
             raise LLMTimeoutError(
                 f"OpenAI request timed out after {self.timeout}s"
             ) from e
-        except APIError as e:
+        except sdk.APIError as e:
             if e.status_code and e.status_code >= 500:
                 raise LLMNetworkError(f"OpenAI server error: {e.status_code}") from e
             raise LLMInvalidResponseError(f"OpenAI API error: {str(e)}") from e
         except Exception as e:
             raise LLMInvalidResponseError(f"Failed to query OpenAI: {str(e)}") from e
 
+    def _create_streamed(
+        self, request_params: Dict[str, Any], strict_json: bool
+    ) -> "ChatCompletion":
+        """
+        Run a chat completion with stream=True and assemble the chunks.
+
+        In JSON mode a response that doesn't start with '{' can never parse,
+        so the stream is closed as soon as that is known rather than paying
+        for (and waiting on) the rest of the output before retrying.
+
+        Args:
+            request_params: Parameters from _build_request()
+            strict_json: Whether the content must be a bare JSON object
+
+        Returns:
+            ChatCompletion equivalent to the non-streamed response
+
+        Raises:
+            LLMInvalidResponseError: If the response can't be JSON
+        """
+        parts = []
+        started = False
+        finish_reason = None
+        usage = None
+        chunk = None
+
+        with self.client.chat.completions.create(
+            **request_params, stream=True, stream_options={"include_usage": True}
+        ) as stream:
+            for chunk in stream:
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                content = choice.delta.content
+                if content:
+                    if strict_json and not started:
+                        stripped = content.lstrip()
+                        if stripped and not stripped.startswith("{"):
+                            raise LLMInvalidResponseError(
+                                "Failed to parse JSON response: streamed "
+                                f"response does not start with '{{': {content!r}"
+                            )
+                        started = bool(stripped)
+                    parts.append(content)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+
+        if chunk is None:
+            raise LLMInvalidResponseError("Empty stream from OpenAI")
+
+        chat_types = _openai().types.chat
+        return chat_types.ChatCompletion(
+            id=chunk.id,
+            object="chat.completion",
+            created=chunk.created,
+            model=chunk.model,
+            system_fingerprint=chunk.system_fingerprint,
+            choices=[
+                chat_types.chat_completion.Choice(
+                    index=0,
+                    finish_reason=finish_reason or "stop",
+                    message=chat_types.ChatCompletionMessage(
+                        role="assistant", content="".join(parts)
+                    ),
+                )
+            ],
+            usage=usage,
+        )
+
+    def _build_request(
+        self, prompt: str, **kwargs
+    ) -> tuple[Dict[str, Any], bool, bool]:
+        """
+        Build chat completion request parameters for a prompt.
+
+        Args:
+            prompt: The prompt text
+            **kwargs: Optional overrides for model, max_tokens, temperature,
+                parse_json, structured_outputs, plus response_schema (a
+                ResponseSchema) to request structured output matching it in
+                JSON mode when structured_outputs is enabled
+
+        Returns:
+            Tuple of (request params, parse_json, enable_json_mode)
+        """
+        model = kwargs.get("model", self.model)
+        max_tokens = kwargs.get("max_tokens", self.max_tokens)
+        temperature = kwargs.get("temperature", self.temperature)
+        parse_json = kwargs.get("parse_json", True)  # Default to parsing JSON
+        enable_json_mode = kwargs.get("enable_json_mode", self.enable_json_mode)
+
+        # Build request parameters
+        request_params = {
+            "model": model,
+            "messages": [SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+        # Enable JSON mode if requested and supported. With a response schema
+        # and Structured Outputs the model is constrained to its fields too,
+        # so responses that parse but fail validation (and the retry that
+        # follows) become rare. strict is left off: optional fields must stay
+        # omittable. Other models fall back to plain JSON mode.
+        response_schema = kwargs.get("response_schema")
+        structured_outputs = kwargs.get("structured_outputs", self.structured_outputs)
+        if (
+            enable_json_mode
+            and parse_json
+            and structured_outputs
+            and response_schema is not None
+        ):
+            request_params["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": response_schema.query_type,
+                    "schema": response_schema.json_schema,
+                    "strict": False,
+                },
+            }
+        elif enable_json_mode and parse_json:
+            request_params["response_format"] = {"type": "json_object"}
+
+        return request_params, parse_json, enable_json_mode
+
+    def _parse_response(
+        self,
+        response: "ChatCompletion",
+        model: str,
+        parse_json: bool,
+        enable_json_mode: bool,
+        cost_multiplier: float = 1.0,
+    ) -> Dict[str, Any]:
+        """
+        Turn a chat completion into the provider's content/metadata dict.
+
+        Args:
+            response: Chat completion returned by the API
+            model: Model requested (used for pricing)
+            parse_json: Whether to parse the content as JSON
+            enable_json_mode: Whether JSON mode was requested
+            cost_multiplier: Discount applied to the cost estimate (Batch API)
+
+        Returns:
+            Dict with 'content' and 'metadata' keys
+
+        Raises:
+            LLMInvalidResponseError: If the response can't be parsed
+        """
         # Parse response
         try:
             raw_content = response.choices[0].message.content
@@ -131,6 +428,7 @@ class OpenAIProvider(BaseLLMProvider):
                 total_cost = (prompt_tokens / 1_000_000) * 0.50 + (
                     completion_tokens / 1_000_000
                 ) * 1.50
+            total_cost *= cost_multiplier
 
             # Parse JSON if requested
             content = raw_content
@@ -179,17 +477,202 @@ class OpenAIProvider(BaseLLMProvider):
                 f"Invalid response format from OpenAI: {str(e)}"
             ) from e
 
+    def embed(self, text: str, model: str = "text-embedding-3-small") -> list[float]:
+        """
+        Get the embedding vector for a piece of text.
+
+        Args:
+            text: Text to embed
+            model: OpenAI embedding model (text-embedding-3 vectors are
+                unit length, so cosine similarity is a dot product)
+
+        Returns:
+            The embedding as a list of floats
+        """
+        # Billed and rate limited like completions, so sent the same way
+        with self._translate_errors():
+            response = self._call(
+                lambda: self.client.embeddings.create(model=model, input=text)
+            )
+        return response.data[0].embedding
+
+    def submit_batch(self, prompts: Dict[str, str], **kwargs) -> str:
+        """
+        Submit prompts as an OpenAI Batch API job.
+
+        Batch jobs complete within 24 hours at half the price of regular
+        requests, which suits offline insight generation.
+
+        Args:
+            prompts: Mapping of custom_id -> prompt text
+            **kwargs: Same overrides as query(), plus 'metadata' for the batch
+
+        Returns:
+            The OpenAI batch ID
+
+        Raises:
+            LLMProviderError: If the upload or batch creation fails
+        """
+        lines = []
+        for custom_id, prompt in prompts.items():
+            request_params, _, _ = self._build_request(prompt, **kwargs)
+            lines.append(
+                orjson.dumps(
+                    {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": BATCH_ENDPOINT,
+                        "body": request_params,
+                    }
+                )
+            )
+
+        sdk = _openai()
+        try:
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", b"\n".join(lines)), purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint=BATCH_ENDPOINT,
+                completion_window="24h",
+                metadata=kwargs.get("metadata"),
+            )
+        except sdk.AuthenticationError as e:
+            raise LLMAuthenticationError(
+                "OpenAI authentication failed. Check your API key."
+            ) from e
+        except sdk.APIError as e:
+            raise LLMProviderError(f"Failed to submit OpenAI batch: {str(e)}") from e
+
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(lines)} requests")
+        return batch.id
+
+    def get_batch_results(self, batch_id: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the results of a Batch API job.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+            **kwargs: Same overrides as query() (parse_json, enable_json_mode)
+
+        Returns:
+            None if the batch is still running, otherwise a mapping of
+            custom_id -> response dict (as returned by query()) or the
+            LLMProviderError raised for that request
+
+        Raises:
+            LLMProviderError: If the batch failed, expired or was cancelled
+        """
+        _, parse_json, enable_json_mode = self._build_request("", **kwargs)
+
+        sdk = _openai()
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in BATCH_PENDING_STATUSES:
+                return None
+            if batch.status != "completed":
+                raise LLMProviderError(
+                    f"OpenAI batch {batch_id} ended with status '{batch.status}'"
+                )
+
+            results = {}
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    output = self.client.files.content(file_id).content
+                    for line in output.splitlines():
+                        if line.strip():
+                            item = orjson.loads(line)
+                            results[item["custom_id"]] = self._parse_batch_item(
+                                item, parse_json, enable_json_mode
+                            )
+        except sdk.AuthenticationError as e:
+            raise LLMAuthenticationError(
+                "OpenAI authentication failed. Check your API key."
+            ) from e
+        except sdk.APIError as e:
+            raise LLMProviderError(
+                f"Failed to fetch OpenAI batch {batch_id}: {str(e)}"
+            ) from e
+
+        return results
+
+    def get_batch_prompts(self, batch_id: str) -> Dict[str, str]:
+        """
+        Read back the prompts a Batch API job was submitted with.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+
+        Returns:
+            Mapping of custom_id -> prompt text, as sent in the batch
+            input file
+
+        Raises:
+            LLMProviderError: If the batch or its input file can't be fetched
+        """
+        sdk = _openai()
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            content = self.client.files.content(batch.input_file_id).content
+        except sdk.AuthenticationError as e:
+            raise LLMAuthenticationError(
+                "OpenAI authentication failed. Check your API key."
+            ) from e
+        except sdk.APIError as e:
+            raise LLMProviderError(
+                f"Failed to fetch OpenAI batch {batch_id} input: {str(e)}"
+            ) from e
+
+        prompts = {}
+        for line in content.splitlines():
+            if line.strip():
+                item = orjson.loads(line)
+                prompts[item["custom_id"]] = item["body"]["messages"][-1]["content"]
+        return prompts
+
+    def _parse_batch_item(
+        self, item: Dict[str, Any], parse_json: bool, enable_json_mode: bool
+    ) -> Any:
+        """Parse one line of a batch output/error file."""
+        response = item.get("response") or {}
+        if item.get("error") or response.get("status_code") != 200:
+            error = item.get("error") or response.get("body", {}).get("error")
+            return LLMInvalidResponseError(f"OpenAI batch request failed: {error}")
+
+        try:
+            completion = _openai().types.chat.ChatCompletion.model_validate(
+                response["body"]
+            )
+            return self._parse_response(
+                completion,
+                completion.model,
+                parse_json,
+                enable_json_mode,
+                cost_multiplier=BATCH_COST_MULTIPLIER,
+            )
+        except LLMInvalidResponseError as e:
+            return e
+        except ValueError as e:
+            return LLMInvalidResponseError(
+                f"Invalid batch response format from OpenAI: {str(e)}"
+            )
+
+    def warmup(self):
+        """Open a pooled connection with a free models listing request."""
+        self.client.models.list()
+
     def validate_credentials(self) -> bool:
         """
-        Validate OpenAI API credentials by making a minimal test query.
+        Validate OpenAI API credentials by listing models (no tokens billed).
 
         Returns:
             True if credentials are valid
         """
         try:
-            # Make a minimal query to test authentication
-            result = self.query("Test query. Respond with 'OK'.", max_tokens=10)
-            return "content" in result and len(result["content"]) > 0
+            with self._translate_errors():
+                self.client.models.list()
+            return True
         except LLMAuthenticationError:
             return False
         except Exception as e:
@@ -6,13 +6,18 @@ making it ideal for queries that require current information like reviews,
 news, and pricing.
 """
 
+import asyncio
 import httpx
 import logging
+import orjson
+import time
+from contextlib import contextmanager
 from typing import Dict, Any
-from .base_provider import BaseLLMProvider
+from .base_provider import BaseLLMProvider, RETRYABLE_CONNECT_ERRORS
 from .pricing import PerplexityPricing
 from .json_parser import parse_llm_json, JSONParseError
 from .exceptions import (
+    LLMProviderError,
     LLMAuthenticationError,
     LLMRateLimitError,
     LLMInvalidResponseError,
@@ -22,6 +27,12 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Sent first in every request; built once and shared (never mutated)
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a JSON API that provides accurate, structured information about products based on web search results. Always respond with valid JSON only.",
+}
+
 
 class PerplexityProvider(BaseLLMProvider):
     """
@@ -32,6 +43,16 @@ class PerplexityProvider(BaseLLMProvider):
 
     BASE_URL = "https://api.perplexity.ai/chat/completions"
 
+    __slots__ = (
+        "model",
+        "max_tokens",
+        "temperature",
+        "timeout",
+        "enable_json_mode",
+        "max_connections",
+        "client",
+    )
+
     def __init__(self, api_key: str, **kwargs):
         super().__init__(api_key, **kwargs)
         self.model = kwargs.get("model", "sonar")
@@ -41,6 +62,17 @@ class PerplexityProvider(BaseLLMProvider):
         self.enable_json_mode = kwargs.get(
             "enable_json_mode", False
         )  # Perplexity may not support JSON mode
+        self.max_connections = kwargs.get("max_connections", 20)
+
+        # Pooled client reused across queries so keep-alive connections skip
+        # the TCP/TLS handshake after the first request
+        self.client = httpx.Client(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
 
     @property
     def provider_name(self) -> str:
@@ -57,26 +89,129 @@ class PerplexityProvider(BaseLLMProvider):
         Returns:
             Dict with 'content' (parsed JSON dict if parse_json=True, else string) and 'metadata' keys
         """
+        payload, parse_json, enable_json_mode = self._build_request(prompt, **kwargs)
+
+        with self._translate_errors():
+            data = self._check_response(self._post(orjson.dumps(payload)))
+
+        return self._parse_response(
+            data, payload["model"], parse_json, enable_json_mode
+        )
+
+    async def aquery(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """
+        Query Perplexity AI without blocking the event loop.
+
+        Args:
+            prompt: The prompt text
+            **kwargs: Same overrides as query()
+
+        Returns:
+            Same dict as query()
+        """
+        payload, parse_json, enable_json_mode = self._build_request(prompt, **kwargs)
+
+        with self._translate_errors():
+            data = self._check_response(await self._apost(orjson.dumps(payload)))
+
+        return self._parse_response(
+            data, payload["model"], parse_json, enable_json_mode
+        )
+
+    def _post(self, body: bytes) -> httpx.Response:
+        """
+        POST a request body, retrying rate limits and failed connections with
+        backoff. Read timeouts aren't retried: Perplexity may still process
+        (and bill) the request.
+
+        Returns:
+            The last response; status handling is left to _check_response()
+        """
+        waited = 0.0
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit()
+            try:
+                response = self.client.post(
+                    self.BASE_URL, headers=self._headers(), content=body
+                )
+            except RETRYABLE_CONNECT_ERRORS:
+                delay = self._retry_delay(attempt, None, waited, "could not connect")
+                if delay is None:
+                    raise
+            else:
+                if response.status_code != 429:
+                    return response
+                delay = self._retry_delay(
+                    attempt, response.headers.get("retry-after"), waited, "rate limited"
+                )
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            waited += delay
+
+    async def _apost(self, body: bytes) -> httpx.Response:
+        """Async version of _post(), sleeping without blocking the loop."""
+        waited = 0.0
+        for attempt in range(self.max_retries + 1):
+            await self._await_rate_limit()
+            try:
+                response = await self._get_async_client().post(
+                    self.BASE_URL, headers=self._headers(), content=body
+                )
+            except RETRYABLE_CONNECT_ERRORS:
+                delay = self._retry_delay(attempt, None, waited, "could not connect")
+                if delay is None:
+                    raise
+            else:
+                if response.status_code != 429:
+                    return response
+                delay = self._retry_delay(
+                    attempt, response.headers.get("retry-after"), waited, "rate limited"
+                )
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def _create_async_client(self) -> httpx.AsyncClient:
+        """Create a pooled async client; see BaseLLMProvider._get_async_client()."""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+
+    def _headers(self) -> Dict[str, str]:
+        """Request headers carrying the API key."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _build_request(
+        self, prompt: str, **kwargs
+    ) -> tuple[Dict[str, Any], bool, bool]:
+        """
+        Build the chat completion payload for a prompt.
+
+        Args:
+            prompt: The prompt text
+            **kwargs: Optional overrides for model, max_tokens, temperature, parse_json
+
+        Returns:
+            Tuple of (payload, parse_json, enable_json_mode)
+        """
         model = kwargs.get("model", self.model)
         max_tokens = kwargs.get("max_tokens", self.max_tokens)
         temperature = kwargs.get("temperature", self.temperature)
         parse_json = kwargs.get("parse_json", True)  # Default to parsing JSON
         enable_json_mode = kwargs.get("enable_json_mode", self.enable_json_mode)
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
         payload = {
             "model": model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a JSON API that provides accurate, structured information about products based on web search results. Always respond with valid JSON only.",
-                },
-                {"role": "user", "content": prompt},
-            ],
+            "messages": [SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
             "max_tokens": max_tokens,
             "temperature": temperature,
             "top_p": 0.9,
@@ -92,31 +227,15 @@ class PerplexityProvider(BaseLLMProvider):
         logger.debug(
             f"Querying Perplexity with model={model}, max_tokens={max_tokens}, json_mode={enable_json_mode}"
         )
+        return payload, parse_json, enable_json_mode
 
+    @contextmanager
+    def _translate_errors(self):
+        """Map httpx and unexpected exceptions to LLMProviderError subclasses."""
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(self.BASE_URL, headers=headers, json=payload)
-
-                # Handle different HTTP status codes
-                if response.status_code == 401:
-                    raise LLMAuthenticationError(
-                        "Perplexity authentication failed. Check your API key."
-                    )
-                elif response.status_code == 429:
-                    raise LLMRateLimitError(
-                        "Perplexity rate limit exceeded. Please try again later."
-                    )
-                elif response.status_code >= 500:
-                    raise LLMNetworkError(
-                        f"Perplexity server error: {response.status_code}"
-                    )
-                elif response.status_code != 200:
-                    raise LLMInvalidResponseError(
-                        f"Unexpected status code {response.status_code}: {response.text}"
-                    )
-
-                data = response.json()
-
+            yield
+        except LLMProviderError:
+            raise
         except httpx.TimeoutException as e:
             raise LLMTimeoutError(
                 f"Perplexity request timed out after {self.timeout}s"
@@ -126,22 +245,57 @@ class PerplexityProvider(BaseLLMProvider):
                 f"Network error connecting to Perplexity: {str(e)}"
             ) from e
         except Exception as e:
-            if isinstance(
-                e,
-                (
-                    LLMAuthenticationError,
-                    LLMRateLimitError,
-                    LLMInvalidResponseError,
-                    LLMTimeoutError,
-                    LLMNetworkError,
-                ),
-            ):
-                raise
             raise LLMInvalidResponseError(
                 f"Failed to query Perplexity: {str(e)}"
             ) from e
 
-        # Parse response
+    def _check_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """
+        Raise for error status codes and decode the response body.
+
+        Returns:
+            The decoded JSON response
+        """
+        if response.status_code == 401:
+            raise LLMAuthenticationError(
+                "Perplexity authentication failed. Check your API key."
+            )
+        elif response.status_code == 429:
+            raise LLMRateLimitError(
+                "Perplexity rate limit exceeded. Please try again later."
+            )
+        elif response.status_code >= 500:
+            raise LLMNetworkError(f"Perplexity server error: {response.status_code}")
+        elif response.status_code != 200:
+            raise LLMInvalidResponseError(
+                f"Unexpected status code {response.status_code}: {response.text}"
+            )
+
+        return orjson.loads(response.content)
+
+    def _parse_response(
+        self,
+        data: Dict[str, Any],
+        model: str,
+        parse_json: bool,
+        enable_json_mode: bool,
+    ) -> Dict[str, Any]:
+        """
+        Convert a decoded chat completion into the provider response dict.
+
+        Args:
+            data: Decoded JSON response
+            model: Model the request was made with (for pricing)
+            parse_json: Whether to parse the content as JSON
+            enable_json_mode: Whether JSON mode was requested
+
+        Returns:
+            Dict with 'content' and 'metadata' keys
+
+        Raises:
+            LLMInvalidResponseError: If the response is malformed or the
+                content is not valid JSON
+        """
         try:
             raw_content = data["choices"][0]["message"]["content"]
             usage = data.get("usage", {})
@@ -213,23 +367,39 @@ class PerplexityProvider(BaseLLMProvider):
                 f"Invalid response format from Perplexity: {str(e)}"
             ) from e
 
+    def warmup(self):
+        """Open a pooled connection; the response status doesn't matter."""
+        self.client.head(self.BASE_URL)
+
     def validate_credentials(self) -> bool:
         """
-        Validate Perplexity API credentials by making a minimal test query.
+        Validate Perplexity API credentials without running a completion.
+
+        Perplexity has no free authenticated endpoint, so this posts a
+        request with no messages: the API key is checked before the body,
+        so a bad key gets a 401 while a good one gets a (free) 400.
 
         Returns:
             True if credentials are valid
         """
+        body = orjson.dumps({"model": self.model, "messages": []})
         try:
-            # Make a minimal query to test authentication
-            result = self.query("Test query. Respond with 'OK'.", max_tokens=10)
-            return "content" in result and len(result["content"]) > 0
-        except LLMAuthenticationError:
-            return False
-        except Exception as e:
+            with self._translate_errors():
+                response = self.client.post(
+                    self.BASE_URL, headers=self._headers(), content=body
+                )
+        except LLMProviderError as e:
             logger.warning(f"Credential validation failed: {str(e)}")
             return False
 
+        if response.status_code >= 500:
+            logger.warning(
+                f"Credential validation failed: Perplexity server error "
+                f"{response.status_code}"
+            )
+            return False
+        return response.status_code not in (401, 403)
+
     def estimate_cost(self, tokens_used: int, is_input: bool = False) -> float:
         """
         Estimate cost for Perplexity queries.
@@ -13,6 +13,7 @@ Pricing sources:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict
 import logging
 
@@ -66,12 +67,18 @@ class BasePricing:
     DEFAULT_MODEL: str = ""
 
     @classmethod
+    @lru_cache(maxsize=64)
     def get_pricing(cls, model: str) -> ModelPricing:
         """
         Get pricing for a model.
 
+        Resolved once per model name, so the fallback warning for an unknown
+        model is logged once rather than on every query.
+
         Args:
-            model: Exact model name as used in API calls
+            model: Model name as used in API calls or reported in responses
+                (dated snapshots like "gpt-5-mini-2025-08-07" match their
+                base model)
 
         Returns:
             ModelPricing instance
@@ -79,6 +86,11 @@ class BasePricing:
         if model in cls.MODELS:
             return cls.MODELS[model]
 
+        # Dated snapshot of a known model - use the longest matching base name
+        base_models = [name for name in cls.MODELS if model.startswith(f"{name}-")]
+        if base_models:
+            return cls.MODELS[max(base_models, key=len)]
+
         # Unknown model - use fallback
         logger.warning(
             f"Unknown {cls.__name__} model '{model}', using {cls.DEFAULT_MODEL} pricing as fallback"
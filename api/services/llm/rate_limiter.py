@@ -0,0 +1,72 @@
+"""
+Client-side rate limiting for LLM provider requests.
+
+Concurrent callers (e.g. LLMService.get_product_insights_bulk) can otherwise
+send bursts that trip provider 429s and burn retries.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing `rate_per_sec` requests per second on
+    average with bursts of up to `capacity` requests.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(
+                    self.capacity, self._tokens + elapsed * self.rate_per_sec
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate_per_sec
+
+            # Sleep without holding the lock so other threads can refill/check
+            time.sleep(wait)
+
+
+# One bucket per provider and limit, shared by every LLMService in the process
+_buckets: Dict[tuple[str, int], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(provider_name: str, rpm: Optional[int]) -> Optional[TokenBucket]:
+    """
+    Get the shared token bucket for a provider.
+
+    Args:
+        provider_name: Name of the provider
+        rpm: Allowed requests per minute; falsy disables rate limiting
+
+    Returns:
+        TokenBucket, or None if the provider is not rate limited
+    """
+    if not rpm:
+        return None
+
+    key = (provider_name, rpm)
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            rate_per_sec = rpm / 60
+            bucket = TokenBucket(rate_per_sec, capacity=max(1.0, rate_per_sec))
+            _buckets[key] = bucket
+    return bucket
@@ -4,8 +4,32 @@ Schema definitions and validation for structured LLM responses.
 Each query_type has a defined schema that specifies the expected JSON structure.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import cached_property
+
+# Type coercion applied to LLM values, keyed by FieldDefinition.field_type
+COERCERS: Dict[type, Callable[[Any], Any]] = {
+    float: lambda value: float(value) if isinstance(value, (int, str)) else value,
+    int: lambda value: int(value) if isinstance(value, (float, str)) else value,
+    str: lambda value: value if isinstance(value, str) else str(value),
+    bool: lambda value: (
+        value.lower() in ("true", "yes", "1") if isinstance(value, str) else value
+    ),
+    list: lambda value: (
+        value if isinstance(value, list) else ([value] if value else [])
+    ),
+}
+
+# JSON Schema type for each FieldDefinition.field_type
+JSON_TYPES: Dict[type, str] = {
+    str: "string",
+    float: "number",
+    int: "integer",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
 
 
 @dataclass
@@ -27,6 +51,37 @@ class ResponseSchema:
     fields: Dict[str, FieldDefinition]
     description: str = ""
 
+    @cached_property
+    def validators(
+        self,
+    ) -> Tuple[Tuple[str, FieldDefinition, Optional[Callable[[Any], Any]]], ...]:
+        """(name, definition, coercer) per field, resolved once per schema"""
+        return tuple(
+            (name, defn, COERCERS.get(defn.field_type))
+            for name, defn in self.fields.items()
+        )
+
+    @cached_property
+    def field_types(self) -> Tuple[Tuple[str, type], ...]:
+        """(name, field_type) per field, for validate_response's fast path"""
+        return tuple((name, defn.field_type) for name, defn in self.fields.items())
+
+    @cached_property
+    def json_schema(self) -> Dict[str, Any]:
+        """JSON Schema for the response, for providers' structured output modes"""
+        properties = {}
+        for name, defn in self.fields.items():
+            prop = {"description": defn.description}
+            if defn.field_type in JSON_TYPES:
+                prop["type"] = JSON_TYPES[defn.field_type]
+            properties[name] = prop
+        return {
+            "type": "object",
+            "properties": properties,
+            "required": self.get_required_fields(),
+            "additionalProperties": False,
+        }
+
     def get_required_fields(self) -> List[str]:
         """Get list of required field names"""
         return [name for name, defn in self.fields.items() if defn.required]
@@ -199,32 +254,34 @@ def validate_response(data: dict, schema: ResponseSchema) -> Dict[str, Any]:
     Raises:
         ValueError: If required fields are missing or invalid
     """
+    # Well-formed responses (every field present with exactly the expected
+    # type) are the common case and need no coercion or defaults
+    try:
+        if all(
+            type(data[name]) is field_type for name, field_type in schema.field_types
+        ):
+            return {name: data[name] for name, _ in schema.field_types}
+    except KeyError:
+        pass
+
     validated = {}
     missing_required = []
 
-    for field_name, field_def in schema.fields.items():
+    for field_name, field_def, coerce in schema.validators:
         if field_name in data:
             value = data[field_name]
 
             # Type coercion
-            try:
-                if field_def.field_type is float and isinstance(value, (int, str)):
-                    value = float(value)
-                elif field_def.field_type is int and isinstance(value, (float, str)):
-                    value = int(value)
-                elif field_def.field_type is str and not isinstance(value, str):
-                    value = str(value)
-                elif field_def.field_type is bool and isinstance(value, str):
-                    value = value.lower() in ("true", "yes", "1")
-                elif field_def.field_type is list and not isinstance(value, list):
-                    value = [value] if value else []
-            except (ValueError, TypeError):
-                if field_def.required:
-                    raise ValueError(
-                        f"Field '{field_name}' has invalid type. "
-                        f"Expected {field_def.field_type.__name__}, got {type(value).__name__}"
-                    )
-                value = field_def.default
+            if coerce is not None:
+                try:
+                    value = coerce(value)
+                except (ValueError, TypeError):
+                    if field_def.required:
+                        raise ValueError(
+                            f"Field '{field_name}' has invalid type. "
+                            f"Expected {field_def.field_type.__name__}, got {type(value).__name__}"
+                        )
+                    value = field_def.default
 
             validated[field_name] = value
         else:
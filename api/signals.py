@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import LLMPrompt
+from .services.llm.llm_service import clear_prompt_cache
+
+
+@receiver(post_save, sender=LLMPrompt)
+@receiver(post_delete, sender=LLMPrompt)
+def invalidate_prompt_cache(sender, **kwargs):
+    """Keep the LLM service's active prompt cache in step with prompt edits"""
+    clear_prompt_cache()
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 import responses
 
@@ -7,6 +8,8 @@ class MockedAPITestCase(TestCase):
 
     def setUp(self):
         super().setUp()
+        # Cached DE API lookups would otherwise leak between tests
+        cache.clear()
         # Start responses - this will catch all requests.get/post/etc calls
         responses.start()
 
@@ -6,7 +6,7 @@ from api.tests.fixtures import (
     create_mock_de_product_empty_response,
     TEST_UPC_API_SUCCESS,
 )
-from api.services.de_product_api import DEProductAPI
+from api.services.de_product_api import DEProductAPI, is_valid_upc
 
 
 # Test configuration for DE Product API
@@ -47,6 +47,18 @@ class DEProductAPITest(MockedAPITestCase):
         self.assertEqual(result["brand"], "Test Brand")
         self.assertEqual(result["upc_code"], TEST_UPC_API_SUCCESS)
 
+    def test_get_product_upc_e(self):
+        """Test that an 8-digit UPC-E code is looked up like any other"""
+        mock_response = create_mock_de_product_response(
+            description="UPC-E Product", brand="Test Brand", upc="04252614"
+        )
+        responses.add(responses.GET, self.base_url, json=mock_response, status=200)
+
+        result = DEProductAPI().get_product("04252614")
+
+        self.assertEqual(result["description"], "UPC-E Product")
+        self.assertEqual(len(responses.calls), 1)
+
     def test_get_product_empty_response(self):
         """Test API returns empty results"""
         responses.add(
@@ -92,6 +104,110 @@ class DEProductAPITest(MockedAPITestCase):
         self.assertIn("language", request.url)
         self.assertIn("field_names", request.url)
 
+    def test_get_product_caches_responses(self):
+        """Test that repeat lookups, including 'not found', skip the API"""
+        other_upc = "036000291452"
+        responses.add(
+            responses.GET,
+            self.base_url,
+            json=create_mock_de_product_response(description="Test Product"),
+            status=200,
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"upc_code": TEST_UPC_API_SUCCESS}, strict_match=False
+                )
+            ],
+        )
+        responses.add(
+            responses.GET,
+            self.base_url,
+            json=create_mock_de_product_empty_response(),
+            status=200,
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"upc_code": other_upc}, strict_match=False
+                )
+            ],
+        )
+
+        api = DEProductAPI()
+        for _ in range(2):
+            self.assertEqual(
+                api.get_product(TEST_UPC_API_SUCCESS)["description"], "Test Product"
+            )
+            self.assertIsNone(api.get_product(other_upc))
+
+        self.assertEqual(len(responses.calls), 2)
+
+    def test_get_product_invalid_upc_skips_api(self):
+        """Test that malformed UPCs return None without calling the API"""
+        api = DEProductAPI()
+        for upc in ["111111111111", "12345", "12345678901a", "4006381333931"]:
+            self.assertIsNone(api.get_product(upc))
+
+        self.assertEqual(len(responses.calls), 0)
+
+    def test_is_valid_upc(self):
+        """Test UPC length and check digit validation"""
+        # 04252614 is UPC-E; its check digit only holds for the UPC-A form
+        for upc in ["123456789012", "036000291452", "96385074", "04252614"]:
+            self.assertTrue(is_valid_upc(upc), upc)
+        for upc in ["123456789013", "0360002914", "", None, "03600029145a"]:
+            self.assertFalse(is_valid_upc(upc), upc)
+        # EAN-13/GTIN-14 don't fit Product.upc_code
+        for upc in ["4006381333931", "10012345678902"]:
+            self.assertFalse(is_valid_upc(upc), upc)
+
+    def test_get_product_retries_transient_errors(self):
+        """Test that transient 5xx responses are retried on the shared session"""
+        responses.add(responses.GET, self.base_url, json={}, status=503)
+        responses.add(
+            responses.GET,
+            self.base_url,
+            json=create_mock_de_product_response(description="Test Product"),
+            status=200,
+        )
+
+        api = DEProductAPI()
+        result = api.get_product(TEST_UPC_API_SUCCESS)
+
+        self.assertEqual(result["description"], "Test Product")
+        self.assertEqual(len(responses.calls), 2)
+
+    def test_get_products(self):
+        """Test looking up several UPC codes in one call"""
+        other_upc = "036000291452"
+        responses.add(
+            responses.GET,
+            self.base_url,
+            json=create_mock_de_product_response(upc=TEST_UPC_API_SUCCESS),
+            status=200,
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"upc_code": TEST_UPC_API_SUCCESS}, strict_match=False
+                )
+            ],
+        )
+        responses.add(
+            responses.GET,
+            self.base_url,
+            json=create_mock_de_product_empty_response(),
+            status=200,
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"upc_code": other_upc}, strict_match=False
+                )
+            ],
+        )
+
+        api = DEProductAPI()
+        result = api.get_products([TEST_UPC_API_SUCCESS, other_upc, other_upc])
+
+        self.assertEqual(list(result), [TEST_UPC_API_SUCCESS, other_upc])
+        self.assertEqual(result[TEST_UPC_API_SUCCESS]["upc_code"], TEST_UPC_API_SUCCESS)
+        self.assertIsNone(result[other_upc])
+        self.assertEqual(len(responses.calls), 2)
+
     def test_make_auth_token(self):
         """Test authentication token generation"""
         api = DEProductAPI()
@@ -101,6 +217,9 @@ class DEProductAPITest(MockedAPITestCase):
         self.assertIsInstance(token, str)
         self.assertGreater(len(token), 0)
 
+        # Base64 HMAC-SHA1 of the UPC keyed with auth_key
+        self.assertEqual(token, "SC1kM8YaZOzyKCu26MeBrCbo0Pw=")
+
         # Same input should produce same token
         token2 = api.make_auth_token("test_upc")
         self.assertEqual(token, token2)
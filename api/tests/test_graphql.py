@@ -8,9 +8,13 @@ from api.tests.fixtures import (
 )
 from graphene.test import Client
 from api.graphql.schema import schema
-from api.models import Product
+from api.models import Product, LLMPrompt, LLMQueryResult
+from api.services.llm.llm_service import clear_prompt_cache
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 import responses
-
+from unittest.mock import patch
 
 # Test configuration for DE Product API
 TEST_DE_PRODUCT_CONFIG = {
@@ -54,6 +58,103 @@ class GraphQLQueryTest(MockedAPITestCase):
         products = result["data"]["allProducts"]
         self.assertEqual(len(products), 2)
 
+    def test_query_all_products_paginated(self):
+        """Test paging through all products with limit and offset"""
+        query = """
+            query {
+                allProducts(limit: 1, offset: 1) {
+                    upcCode
+                }
+            }
+        """
+        result = self.client.execute(query)
+        self.assertIsNone(result.get("errors"))
+        products = result["data"]["allProducts"]
+        self.assertEqual(len(products), 1)
+        self.assertEqual(products[0]["upcCode"], "222222222222")
+
+    def test_query_all_products_page_size(self):
+        """Test allProducts defaults and caps its page size"""
+        query = "query($limit: Int) { allProducts(limit: $limit) { upcCode } }"
+        with patch("api.graphql.schema.DEFAULT_PAGE_SIZE", 1):
+            result = self.client.execute(query)
+        self.assertIsNone(result.get("errors"))
+        self.assertEqual(len(result["data"]["allProducts"]), 1)
+
+        with patch("api.graphql.schema.MAX_PAGE_SIZE", 1):
+            result = self.client.execute(query, variables={"limit": 2})
+        self.assertIn("at most 1", result["errors"][0]["message"])
+
+    def test_query_all_products_negative_pagination(self):
+        """Test negative limit or offset is rejected with a GraphQL error"""
+        for args in ["limit: -1", "offset: -1"]:
+            result = self.client.execute("query { allProducts(%s) { upcCode } }" % args)
+            self.assertEqual(
+                result["errors"][0]["message"],
+                "limit and offset must not be negative",
+            )
+
+    def test_query_all_products_loads_only_selected_columns(self):
+        """Test the product list query only selects the requested columns"""
+        query = """
+            query {
+                allProducts {
+                    upcCode
+                    name
+                }
+            }
+        """
+        with CaptureQueriesContext(connection) as queries:
+            result = self.client.execute(query)
+
+        self.assertIsNone(result.get("errors"))
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]["sql"]
+        self.assertIn('"upc_code"', sql)
+        self.assertNotIn('"brand"', sql)
+        self.assertNotIn('"de_product_data"', sql)
+
+    def test_query_all_products_batches_insight_cache_lookups(self):
+        """Test insight cache lookups for a product list use a single query"""
+        prompt = LLMPrompt.objects.create(
+            name="test_prompt",
+            query_type="review_summary",
+            prompt_template="Summarize reviews for {product_name}",
+        )
+        for product in (self.product1, self.product2):
+            LLMQueryResult.objects.create(
+                product=product,
+                prompt=prompt,
+                provider="perplexity",
+                query_input="Test query",
+                result={"summary": f"Cached summary for {product.name}"},
+            )
+        clear_prompt_cache()
+
+        query = """
+            query {
+                allProducts {
+                    upcCode
+                    reviewSummary(provider: "perplexity") {
+                        summary
+                        cached
+                    }
+                }
+            }
+        """
+        context = RequestFactory().post("/graphql/")
+        # products, active prompt, batched cache lookup
+        with self.assertNumQueries(3):
+            result = self.client.execute(query, context_value=context)
+
+        self.assertIsNone(result.get("errors"))
+        summaries = [p["reviewSummary"] for p in result["data"]["allProducts"]]
+        self.assertEqual(
+            [s["summary"] for s in summaries],
+            ["Cached summary for Product One", "Cached summary for Product Two"],
+        )
+        self.assertTrue(all(s["cached"] for s in summaries))
+
     def test_query_product_by_upc(self):
         """Test querying a product by UPC code"""
         query = """
@@ -82,10 +183,13 @@ class GraphQLQueryTest(MockedAPITestCase):
                 }}
             }}
         """
-        result = self.client.execute(query)
+        with CaptureQueriesContext(connection) as queries:
+            result = self.client.execute(query)
         self.assertIsNone(result.get("errors"))
         product = result["data"]["productById"]
         self.assertEqual(product["name"], "Product One")
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"de_product_data"', queries[0]["sql"])
 
     def test_query_nonexistent_upc(self):
         """Test querying with non-existent UPC returns None when API returns empty"""
@@ -191,7 +295,7 @@ class GraphQLQueryTest(MockedAPITestCase):
         mock_response = create_mock_de_product_response(
             description="Product with Image",
             brand="Image Brand",
-            upc="333333333333",
+            upc="333333333331",
             image=test_image_url,
         )
         responses.add(
@@ -203,7 +307,7 @@ class GraphQLQueryTest(MockedAPITestCase):
 
         query = """
             query {
-                productByUpc(upc: "333333333333") {
+                productByUpc(upc: "333333333331") {
                     upcCode
                     name
                     brand
@@ -214,11 +318,11 @@ class GraphQLQueryTest(MockedAPITestCase):
         result = self.client.execute(query)
         self.assertIsNone(result.get("errors"))
         product = result["data"]["productByUpc"]
-        self.assertEqual(product["upcCode"], "333333333333")
+        self.assertEqual(product["upcCode"], "333333333331")
         self.assertEqual(product["name"], "Product with Image")
         self.assertEqual(product["brand"], "Image Brand")
         self.assertEqual(product["imageUrl"], test_image_url)
 
         # Verify image URL was saved to database
-        saved_product = Product.objects.get(upc_code="333333333333")
+        saved_product = Product.objects.get(upc_code="333333333331")
         self.assertEqual(saved_product.image_url, test_image_url)
@@ -0,0 +1,82 @@
+"""
+Tests for LLM JSON response parsing.
+"""
+
+from django.test import TestCase
+from api.services.llm.json_parser import (
+    JSONParseError,
+    parse_llm_json,
+    sanitize_json_string,
+)
+
+
+class ParseLLMJsonTestCase(TestCase):
+    """Test parse_llm_json strategies"""
+
+    def test_direct_json(self):
+        """Test pure JSON (with surrounding whitespace) parses directly"""
+        result, strategy = parse_llm_json('\n  {"summary": "Great"}  \n')
+        self.assertEqual(result, {"summary": "Great"})
+        self.assertEqual(strategy, "direct")
+
+    def test_markdown_json_block(self):
+        """Test JSON inside a ```json code block"""
+        raw = 'Here you go:\n```json\n{"summary": "Great"}\n```\nThanks'
+        result, strategy = parse_llm_json(raw)
+        self.assertEqual(result, {"summary": "Great"})
+        self.assertEqual(strategy, "markdown_json")
+
+    def test_markdown_block_without_tag(self):
+        """Test JSON inside an untagged code block"""
+        raw = 'Here you go:\n```\n{"summary": "Great"}\n```'
+        result, strategy = parse_llm_json(raw)
+        self.assertEqual(result, {"summary": "Great"})
+        self.assertEqual(strategy, "markdown_block")
+
+    def test_json_embedded_in_text(self):
+        """Test JSON object surrounded by prose"""
+        raw = 'Sure! {"summary": "Great", "pros": ["a"]} Hope that helps.'
+        result, strategy = parse_llm_json(raw)
+        self.assertEqual(result, {"summary": "Great", "pros": ["a"]})
+        self.assertEqual(strategy, "extract_braces")
+
+    def test_json_embedded_with_other_braces(self):
+        """Test the first complete object is used, ignoring prose braces"""
+        raw = (
+            'Using {placeholders}: {"summary": "Use } and { \\"carefully\\""} '
+            'and also {"summary": "second"}'
+        )
+        result, strategy = parse_llm_json(raw)
+        self.assertEqual(result, {"summary": 'Use } and { "carefully"'})
+        self.assertEqual(strategy, "extract_braces")
+
+    def test_no_json(self):
+        """Test responses without a JSON object raise JSONParseError"""
+        for raw in ["I could not find any reviews.", "} backwards {"]:
+            with self.assertRaises(JSONParseError):
+                parse_llm_json(raw)
+
+    def test_empty_response(self):
+        """Test empty and whitespace-only responses"""
+        for raw in ["", "   \n"]:
+            with self.assertRaises(JSONParseError) as context:
+                parse_llm_json(raw)
+            self.assertIn("Empty response", str(context.exception))
+
+    def test_strict_mode(self):
+        """Test strict mode only accepts direct JSON"""
+        with self.assertRaises(JSONParseError):
+            parse_llm_json('```json\n{"summary": "Great"}\n```', strict=True)
+
+
+class SanitizeJsonStringTestCase(TestCase):
+    """Test sanitize_json_string"""
+
+    def test_strips_markdown_fences(self):
+        """Test tagged, untagged and upper-case fences are removed"""
+        for raw in [
+            '  ```json\n{"a": 1}\n```  ',
+            '```\n{"a": 1}\n```',
+            '```JSON\n{"a": 1}\n```',
+        ]:
+            self.assertEqual(sanitize_json_string(raw), '\n{"a": 1}\n')
@@ -130,6 +130,13 @@ class OpenAIPricingTestCase(TestCase):
         self.assertEqual(pricing.model_name, "gpt-5-mini")
         self.assertEqual(pricing.input_cost_per_million, 0.25)
 
+    def test_dated_snapshot_lookup(self):
+        """Test dated model snapshots reported by the API use their base pricing"""
+        pricing = OpenAIPricing.get_pricing("gpt-5-nano-2025-08-07")
+        self.assertEqual(pricing.model_name, "gpt-5-nano")
+        pricing = OpenAIPricing.get_pricing("gpt-5.1-2025-11-13")
+        self.assertEqual(pricing.model_name, "gpt-5.1")
+
     def test_cost_calculation_gpt5_nano(self):
         """Test actual cost calculation for GPT-5 Nano"""
         pricing = OpenAIPricing.get_pricing("gpt-5-nano")
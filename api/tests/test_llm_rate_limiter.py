@@ -0,0 +1,42 @@
+"""
+Tests for client-side LLM rate limiting.
+"""
+
+from unittest.mock import patch
+from django.test import TestCase
+from api.services.llm.rate_limiter import TokenBucket, get_rate_limiter
+
+
+class TokenBucketTestCase(TestCase):
+    """Test the TokenBucket rate limiter"""
+
+    @patch("api.services.llm.rate_limiter.time")
+    def test_acquire_allows_burst_then_waits(self, mock_time):
+        """Test that requests beyond the burst wait for the bucket to refill"""
+        now = [100.0]
+        mock_time.monotonic.side_effect = lambda: now[0]
+
+        def fake_sleep(seconds):
+            now[0] += seconds
+
+        mock_time.sleep.side_effect = fake_sleep
+
+        bucket = TokenBucket(rate_per_sec=2, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        mock_time.sleep.assert_not_called()
+
+        bucket.acquire()
+        mock_time.sleep.assert_called_once()
+        self.assertAlmostEqual(mock_time.sleep.call_args[0][0], 0.5)
+        self.assertAlmostEqual(now[0], 100.5)
+
+    def test_get_rate_limiter(self):
+        """Test limiters are shared per provider and disabled without a limit"""
+        self.assertIsNone(get_rate_limiter("openai", 0))
+        self.assertIsNone(get_rate_limiter("openai", None))
+
+        limiter = get_rate_limiter("openai", 120)
+        self.assertIs(get_rate_limiter("openai", 120), limiter)
+        self.assertIsNot(get_rate_limiter("perplexity", 120), limiter)
+        self.assertEqual(limiter.rate_per_sec, 2)
@@ -0,0 +1,69 @@
+"""
+Tests for LLM response schema validation.
+"""
+
+from django.test import TestCase
+from api.services.llm.schemas import REVIEW_SUMMARY_SCHEMA, validate_response
+
+
+class ValidateResponseTestCase(TestCase):
+    """Test validate_response coercion and defaults"""
+
+    def test_coerces_types_and_fills_defaults(self):
+        """Test values are coerced to field types and optional fields defaulted"""
+        result = validate_response(
+            {
+                "sentiment": "positive",
+                "sentiment_score": "0.9",
+                "summary": 42,
+                "pros": "Sturdy",
+                "cons": [],
+            },
+            REVIEW_SUMMARY_SCHEMA,
+        )
+
+        self.assertEqual(result["sentiment_score"], 0.9)
+        self.assertEqual(result["summary"], "42")
+        self.assertEqual(result["pros"], ["Sturdy"])
+        self.assertEqual(result["key_themes"], [])
+        self.assertEqual(result["confidence"], "medium")
+
+    def test_conforming_response_fast_path(self):
+        """Test well-formed responses come back unchanged minus unknown keys"""
+        data = {
+            "sentiment": "positive",
+            "sentiment_score": 0.9,
+            "summary": "Great",
+            "pros": ["Sturdy"],
+            "cons": [],
+            "key_themes": ["durability"],
+            "confidence": "high",
+        }
+        result = validate_response({**data, "extra": 1}, REVIEW_SUMMARY_SCHEMA)
+        self.assertEqual(result, data)
+
+        # An int score still goes through coercion
+        result = validate_response(
+            {**data, "sentiment_score": 1}, REVIEW_SUMMARY_SCHEMA
+        )
+        self.assertIsInstance(result["sentiment_score"], float)
+
+    def test_invalid_and_missing_required_fields(self):
+        """Test required fields must be present and coercible"""
+        data = {"sentiment": "positive", "summary": "Ok", "pros": [], "cons": []}
+
+        with self.assertRaises(ValueError) as context:
+            validate_response(
+                {**data, "sentiment_score": "high"}, REVIEW_SUMMARY_SCHEMA
+            )
+        self.assertIn("sentiment_score", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            validate_response(data, REVIEW_SUMMARY_SCHEMA)
+        self.assertIn("Missing required fields", str(context.exception))
+
+    def test_validators_resolved_once(self):
+        """Test per-field validators are computed once per schema"""
+        self.assertIs(
+            REVIEW_SUMMARY_SCHEMA.validators, REVIEW_SUMMARY_SCHEMA.validators
+        )
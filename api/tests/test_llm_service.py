@@ -2,11 +2,22 @@
 Tests for LLM service functionality.
 """
 
+import asyncio
+import httpx
+import json
+from datetime import timedelta
 from django.test import TestCase
 from django.db import IntegrityError
-from unittest.mock import Mock, patch
+from django.utils import timezone
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from api.models import Product, LLMPrompt, LLMQueryResult
-from api.services.llm import LLMService
+from api.services.llm import LLMInvalidResponseError, LLMService
+from api.services.llm.llm_service import (
+    RETRY_PROMPT_SUFFIX,
+    _inflight_queries,
+    clear_provider_cache,
+)
+from api.services.llm.schemas import get_schema
 
 
 class LLMServiceTestCase(TestCase):
@@ -14,6 +25,9 @@ class LLMServiceTestCase(TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
+        # Providers are shared per process; start each test with fresh mocks
+        clear_provider_cache()
+
         # Create a test product
         self.product = Product.objects.create(
             upc_code="123456789012", name="Test Product", brand="Test Brand"
@@ -99,6 +113,426 @@ class LLMServiceTestCase(TestCase):
         self.assertEqual(cached.result["sentiment"], "positive")
         self.assertFalse(cached.is_stale)
 
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    def test_get_product_insight_retries_with_json_reminder(
+        self, mock_settings, mock_provider_class
+    ):
+        """Test a parse failure is retried with stricter JSON instructions"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "providers": {"perplexity": {"api_key": "test_api_key"}},
+        }
+        mock_provider = Mock()
+        mock_provider.provider_name = "perplexity"
+        mock_provider.query.side_effect = [
+            LLMInvalidResponseError("Failed to parse JSON response"),
+            self.mock_llm_response,
+        ]
+        mock_provider_class.return_value = mock_provider
+
+        service = LLMService(default_provider="perplexity")
+        result = service.get_product_insight(
+            product=self.product, query_type="review_summary", provider="perplexity"
+        )
+
+        self.assertEqual(result["content"]["sentiment"], "positive")
+        first_prompt = mock_provider.query.call_args_list[0][0][0]
+        retry_prompt = mock_provider.query.call_args_list[1][0][0]
+        self.assertEqual(retry_prompt, first_prompt + RETRY_PROMPT_SUFFIX)
+        self.assertEqual(result["result_obj"].parse_attempts, 2)
+
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    def test_get_product_insight_does_not_retry_provider_errors(
+        self, mock_settings, mock_provider_class
+    ):
+        """Test rate limits and timeouts are left to the provider's own retries"""
+        from api.services.llm.exceptions import LLMRateLimitError
+
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "providers": {"perplexity": {"api_key": "test_api_key"}},
+        }
+        mock_provider = Mock()
+        mock_provider.provider_name = "perplexity"
+        mock_provider.query.side_effect = LLMRateLimitError("rate limited")
+        mock_provider_class.return_value = mock_provider
+
+        service = LLMService(default_provider="perplexity")
+        result = service.get_product_insight(self.product, "review_summary")
+
+        mock_provider.query.assert_called_once()
+        self.assertEqual(result["content"]["error"], "parsing_failed")
+        self.assertEqual(result["result_obj"].parse_attempts, 1)
+
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    async def test_aget_product_insight(self, mock_settings, mock_provider_class):
+        """Test the async insight path awaits the provider and caches the result"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "providers": {"perplexity": {"api_key": "test_api_key"}},
+        }
+        mock_provider = Mock()
+        mock_provider.provider_name = "perplexity"
+        mock_provider.aquery = AsyncMock(return_value=self.mock_llm_response)
+        mock_provider_class.return_value = mock_provider
+
+        service = LLMService(default_provider="perplexity")
+        result = await service.aget_product_insight(self.product, "review_summary")
+        cached = await service.aget_product_insight(self.product, "review_summary")
+
+        self.assertFalse(result["cached"])
+        self.assertEqual(result["content"]["sentiment"], "positive")
+        self.assertTrue(cached["cached"])
+        mock_provider.aquery.assert_awaited_once()
+        mock_provider.query.assert_not_called()
+
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    async def test_aget_product_insight_coalesces_concurrent_calls(
+        self, mock_settings, mock_provider_class
+    ):
+        """Test concurrent calls for the same insight share one LLM request"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "providers": {"perplexity": {"api_key": "test_api_key"}},
+        }
+
+        async def slow_aquery(prompt, **kwargs):
+            await asyncio.sleep(0.1)
+            return self.mock_llm_response
+
+        mock_provider = Mock()
+        mock_provider.provider_name = "perplexity"
+        mock_provider.aquery = AsyncMock(side_effect=slow_aquery)
+        mock_provider_class.return_value = mock_provider
+
+        service = LLMService(default_provider="perplexity")
+        first, second = await asyncio.gather(
+            service.aget_product_insight(self.product, "review_summary"),
+            service.aget_product_insight(self.product, "review_summary"),
+        )
+
+        self.assertEqual(first["content"], second["content"])
+        mock_provider.aquery.assert_awaited_once()
+        self.assertEqual(_inflight_queries, {})
+
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    async def test_aget_product_insights_bulk(self, mock_settings, mock_provider_class):
+        """Test async bulk insights query misses concurrently, in product order"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "providers": {"perplexity": {"api_key": "test_api_key"}},
+        }
+        mock_provider = Mock()
+        mock_provider.provider_name = "perplexity"
+        mock_provider.aquery = AsyncMock(return_value=self.mock_llm_response)
+        mock_provider_class.return_value = mock_provider
+
+        others = [
+            await Product.objects.acreate(
+                upc_code=f"00000000000{i}", name=f"Product {i}"
+            )
+            for i in range(2)
+        ]
+        await LLMQueryResult.objects.acreate(
+            product=self.product,
+            prompt=self.prompt,
+            provider="perplexity",
+            query_input="Test",
+            result={"summary": "Cached summary"},
+        )
+
+        service = LLMService(default_provider="perplexity")
+        results = await service.aget_product_insights_bulk(
+            [others[0], self.product, others[1]], "review_summary", concurrency=2
+        )
+
+        self.assertEqual(list(results), [others[0].id, self.product.id, others[1].id])
+        self.assertTrue(results[self.product.id]["cached"])
+        self.assertFalse(results[others[0].id]["cached"])
+        self.assertEqual(mock_provider.aquery.await_count, 2)
+
+        # A product listed twice is queried once and shares its result
+        results = await service.aget_product_insights_bulk(
+            [others[0], others[0]], "review_summary", force_refresh=True
+        )
+        self.assertEqual(list(results), [others[0].id])
+        self.assertEqual(mock_provider.aquery.await_count, 3)
+
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    def test_get_product_insights_bulk(self, mock_settings, mock_provider_class):
+        """Test bulk insights serve cache hits and query only the misses"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "max_concurrent_queries": 4,
+            "providers": {"perplexity": {"api_key": "test_api_key"}},
+        }
+        mock_provider = Mock()
+        mock_provider.query.return_value = self.mock_llm_response
+        mock_provider_class.return_value = mock_provider
+
+        others = [
+            Product.objects.create(upc_code=f"00000000000{i}", name=f"Product {i}")
+            for i in range(2)
+        ]
+        LLMQueryResult.objects.create(
+            product=self.product,
+            prompt=self.prompt,
+            provider="perplexity",
+            query_input="Test",
+            result={"summary": "Cached summary"},
+        )
+
+        service = LLMService(default_provider="perplexity")
+        results = service.get_product_insights_bulk(
+            [self.product, *others], query_type="review_summary"
+        )
+
+        self.assertEqual(set(results), {self.product.id, *(p.id for p in others)})
+        self.assertTrue(results[self.product.id]["cached"])
+        self.assertEqual(
+            results[self.product.id]["content"], {"summary": "Cached summary"}
+        )
+        for product in others:
+            self.assertFalse(results[product.id]["cached"])
+            self.assertEqual(results[product.id]["content"]["sentiment"], "positive")
+        self.assertEqual(mock_provider.query.call_count, 2)
+        self.assertEqual(
+            LLMQueryResult.objects.filter(product__in=others).count(), len(others)
+        )
+
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    def test_get_product_insights_bulk_dedupes_products(
+        self, mock_settings, mock_provider_class
+    ):
+        """Test bulk insights query a product listed twice only once"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "providers": {"perplexity": {"api_key": "test_api_key"}},
+        }
+        mock_provider = Mock()
+        mock_provider.query.return_value = self.mock_llm_response
+        mock_provider_class.return_value = mock_provider
+
+        service = LLMService(default_provider="perplexity")
+        results = service.get_product_insights_bulk(
+            [self.product, Product.objects.get(pk=self.product.pk)],
+            query_type="review_summary",
+        )
+
+        self.assertEqual(list(results), [self.product.id])
+        mock_provider.query.assert_called_once()
+        self.assertEqual(LLMQueryResult.objects.filter(product=self.product).count(), 1)
+
+    @patch("api.services.llm.llm_service.OpenAIProvider")
+    @patch("api.services.llm.llm_service.settings")
+    def test_batch_job(self, mock_settings, mock_provider_class):
+        """Test submitting a batch job and caching its results once complete"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "openai",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "providers": {"openai": {"api_key": "test_api_key"}},
+        }
+        mock_provider = Mock()
+        mock_provider.submit_batch.return_value = "batch_123"
+        mock_provider_class.return_value = mock_provider
+        service = LLMService(default_provider="openai")
+
+        batch_id = service.submit_batch_job([self.product], "review_summary")
+
+        self.assertEqual(batch_id, "batch_123")
+        prompts = mock_provider.submit_batch.call_args[0][0]
+        self.assertEqual(
+            mock_provider.submit_batch.call_args.kwargs["response_schema"],
+            get_schema("review_summary"),
+        )
+        custom_id = f"{self.product.id}:{self.prompt.id}"
+        self.assertEqual(
+            prompts, {custom_id: "Summarize reviews for Test Product by Test Brand"}
+        )
+
+        mock_provider.get_batch_results.return_value = None
+        self.assertIsNone(service.poll_batch_job(batch_id))
+        self.assertFalse(LLMQueryResult.objects.exists())
+
+        mock_provider.get_batch_results.return_value = {
+            custom_id: self.mock_llm_response
+        }
+        mock_provider.get_batch_prompts.return_value = prompts
+        # Edits made while the batch runs don't change the stored prompt
+        self.product.name = "Renamed Product"
+        self.product.save()
+        results = service.poll_batch_job(batch_id)
+
+        self.assertEqual(results[self.product.id]["content"]["sentiment"], "positive")
+        cached = LLMQueryResult.objects.get(
+            product=self.product, prompt=self.prompt, provider="openai"
+        )
+        self.assertEqual(cached.result["sentiment"], "positive")
+        self.assertEqual(cached.query_input, prompts[custom_id])
+
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    def test_get_product_insight_reuses_equivalent_prompt_result(
+        self, mock_provider_class
+    ):
+        """Test a result for an equivalent prompt is reused after a prompt edit"""
+        LLMQueryResult.objects.create(
+            product=self.product,
+            prompt=self.prompt,
+            provider="perplexity",
+            query_input="Test",
+            query_fingerprint=LLMQueryResult.make_fingerprint(
+                "Summarize reviews for Test Product by Test Brand"
+            ),
+            result={"summary": "Cached summary"},
+        )
+        self.prompt.is_active = False
+        self.prompt.save()
+        LLMPrompt.objects.create(
+            name="test_prompt_v2",
+            query_type="review_summary",
+            prompt_template="Summarize  reviews for {product_name}\nby {brand} ",
+            is_active=True,
+        )
+
+        service = LLMService(default_provider="perplexity")
+        result = service.get_product_insight(
+            product=self.product, query_type="review_summary", provider="perplexity"
+        )
+
+        self.assertTrue(result["cached"])
+        self.assertEqual(result["content"], {"summary": "Cached summary"})
+        mock_provider_class.assert_not_called()
+
+    @patch("api.services.llm.llm_service.OpenAIProvider")
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    def test_warmup_shares_providers(
+        self, mock_settings, mock_perplexity_class, mock_openai_class
+    ):
+        """Test warmup connects configured providers and later services reuse them"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "providers": {
+                "perplexity": {"api_key": "test_api_key"},
+                "openai": {"api_key": ""},
+            },
+        }
+
+        warmed = LLMService().warmup()
+
+        self.assertEqual(warmed, ["perplexity"])
+        mock_perplexity_class.return_value.warmup.assert_called_once()
+        mock_openai_class.assert_not_called()
+        self.assertIs(
+            LLMService()._get_provider("perplexity"),
+            mock_perplexity_class.return_value,
+        )
+        mock_perplexity_class.assert_called_once()
+
+    @patch("api.services.llm.llm_service.OpenAIProvider")
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    def test_get_product_insight_semantic_cache(
+        self, mock_settings, mock_perplexity_class, mock_openai_class
+    ):
+        """Test a reworded prompt reuses a result with a similar embedding"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "semantic_cache_threshold": 0.95,
+            "providers": {
+                "perplexity": {"api_key": "test_api_key"},
+                "openai": {"api_key": "test_api_key"},
+            },
+        }
+        mock_perplexity_class.return_value.provider_name = "perplexity"
+        mock_perplexity_class.return_value.query.return_value = self.mock_llm_response
+        mock_embed = mock_openai_class.return_value.embed
+
+        LLMQueryResult.objects.create(
+            product=self.product,
+            prompt=self.prompt,
+            provider="perplexity",
+            query_input="Summarize reviews for Test Product by Test Brand",
+            query_embedding=[1.0, 0.0],
+            result={"summary": "Cached summary"},
+        )
+        self.prompt.is_active = False
+        self.prompt.save()
+        LLMPrompt.objects.create(
+            name="test_prompt_v2",
+            query_type="review_summary",
+            prompt_template="What do reviewers say about {product_name} ({brand})?",
+            is_active=True,
+        )
+        service = LLMService(default_provider="perplexity")
+
+        mock_embed.return_value = [0.99, 0.14]
+        result = service.get_product_insight(self.product, "review_summary")
+        self.assertTrue(result["cached"])
+        self.assertEqual(result["content"], {"summary": "Cached summary"})
+        mock_perplexity_class.return_value.query.assert_not_called()
+
+        # Dissimilar prompts query the LLM and store the new prompt's embedding
+        other = Product.objects.create(upc_code="036000291452", name="Other")
+        mock_embed.return_value = [0.0, 1.0]
+        result = service.get_product_insight(other, "review_summary")
+        self.assertFalse(result["cached"])
+        self.assertEqual(
+            LLMQueryResult.objects.get(product=other).query_embedding, [0.0, 1.0]
+        )
+
+    @patch("api.services.llm.llm_service.OpenAIProvider")
+    @patch("api.services.llm.llm_service.PerplexityProvider")
+    @patch("api.services.llm.llm_service.settings")
+    def test_semantic_cache_skipped_without_openai(
+        self, mock_settings, mock_perplexity_class, mock_openai_class
+    ):
+        """Test no embeddings are requested when OpenAI isn't configured"""
+        mock_settings.LLM_CONFIG = {
+            "default_provider": "perplexity",
+            "cache_ttl_days": 30,
+            "enable_caching": True,
+            "semantic_cache_threshold": 0.95,
+            "providers": {
+                "perplexity": {"api_key": "test_api_key"},
+                "openai": {"api_key": ""},
+            },
+        }
+        mock_perplexity_class.return_value.query.return_value = self.mock_llm_response
+
+        service = LLMService(default_provider="perplexity")
+        with self.assertNoLogs("api.services.llm.llm_service", level="WARNING"):
+            result = service.get_product_insight(self.product, "review_summary")
+
+        self.assertFalse(result["cached"])
+        mock_openai_class.assert_not_called()
+
     @patch("api.services.llm.llm_service.PerplexityProvider")
     def test_get_product_insight_cache_hit(self, mock_provider_class):
         """Test getting insight when result is cached (cache hit)"""
@@ -238,6 +672,61 @@ class LLMServiceTestCase(TestCase):
         self.assertTrue(result1.is_stale)
         self.assertFalse(result2.is_stale)
 
+    def test_check_cache_serves_hot_results_from_memory(self):
+        """Test repeat cache hits only revalidate the row until invalidated"""
+        cached = LLMQueryResult.objects.create(
+            product=self.product,
+            prompt=self.prompt,
+            provider="perplexity",
+            query_input="Test",
+            result={"summary": "Cached summary"},
+        )
+        service = LLMService(default_provider="perplexity")
+
+        with self.assertNumQueries(1):
+            first = service._check_cache(self.product, self.prompt, "perplexity")
+        with self.assertNumQueries(1) as queries:
+            second = service._check_cache(self.product, self.prompt, "perplexity")
+        self.assertIs(second, first)
+        self.assertNotIn('"result"', queries.captured_queries[0]["sql"])
+
+        service.invalidate_cache(self.product)
+        self.assertIsNone(service._check_cache(self.product, self.prompt, "perplexity"))
+
+        # Invalidated by another process, which can't clear this LRU
+        LLMQueryResult.objects.filter(pk=cached.pk).update(is_stale=False)
+        service._check_cache(self.product, self.prompt, "perplexity")
+        LLMQueryResult.objects.filter(pk=cached.pk).update(is_stale=True)
+        self.assertIsNone(service._check_cache(self.product, self.prompt, "perplexity"))
+
+    def test_store_result_upserts_existing_row(self):
+        """Test storing a result replaces the existing cache row"""
+        existing = LLMQueryResult.objects.create(
+            product=self.product,
+            prompt=self.prompt,
+            provider="perplexity",
+            query_input="Old query",
+            result={"summary": "Old"},
+            is_stale=True,
+        )
+
+        service = LLMService()
+        stored = service._store_result(
+            product=self.product,
+            prompt=self.prompt,
+            provider="perplexity",
+            query_input="New query",
+            result={"summary": "New"},
+            metadata={"parse_strategy": "direct"},
+        )
+
+        self.assertEqual(stored.pk, existing.pk)
+        self.assertEqual(LLMQueryResult.objects.count(), 1)
+        existing.refresh_from_db()
+        self.assertEqual(existing.result, {"summary": "New"})
+        self.assertEqual(existing.parse_strategy, "direct")
+        self.assertFalse(existing.is_stale)
+
     def test_prompt_rendering(self):
         """Test prompt template rendering with product data"""
         service = LLMService()
@@ -255,6 +744,15 @@ class LLMServiceTestCase(TestCase):
                 product=self.product, query_type="nonexistent_query_type"
             )
 
+    def test_active_prompt_cache_invalidated_on_save(self):
+        """Test the cached active prompt is refreshed when a prompt changes"""
+        service = LLMService()
+        self.assertEqual(service._get_active_prompt("review_summary"), self.prompt)
+
+        self.prompt.is_active = False
+        self.prompt.save()
+        self.assertIsNone(service._get_active_prompt("review_summary"))
+
     def test_get_cache_stats(self):
         """Test cache statistics"""
         # Create some cached results with structured data
@@ -265,7 +763,7 @@ class LLMServiceTestCase(TestCase):
             query_input="Test",
             result={"summary": "Result 1"},
             is_stale=False,
-            metadata={},
+            metadata={"tokens_used": 150, "cost_estimate": 0.00015},
         )
 
         LLMQueryResult.objects.create(
@@ -279,11 +777,15 @@ class LLMServiceTestCase(TestCase):
         )
 
         service = LLMService()
-        stats = service.get_cache_stats(product=self.product)
+        with self.assertNumQueries(1):
+            stats = service.get_cache_stats(product=self.product)
 
         self.assertEqual(stats["total_cached"], 2)
         self.assertEqual(stats["fresh"], 1)
         self.assertEqual(stats["stale"], 1)
+        self.assertEqual(stats["old"], 0)
+        self.assertEqual(stats["total_tokens_used"], 150)
+        self.assertAlmostEqual(stats["total_cost_estimate"], 0.00015)
         self.assertTrue(stats["cache_enabled"])
 
 
@@ -324,6 +826,53 @@ class LLMPromptModelTestCase(TestCase):
         # Should use 'Unknown Brand' as fallback
         self.assertIn("Unknown Brand", rendered)
 
+    def test_prompt_render_matches_str_format(self):
+        """Test compiled rendering gives the same output as str.format"""
+        product = Product.objects.create(
+            upc_code="123456789012", name="Coffee Beans", brand="Best Coffee"
+        )
+        values = {
+            "product_name": "Coffee Beans",
+            "brand": "Best Coffee",
+            "upc_code": "123456789012",
+            "additional_data": "",
+        }
+
+        for template in [
+            'Analyze "{product_name}" by {brand}.\n{{"upc": "{upc_code}"}}',
+            "{brand}{brand} {{literal}} {product_name}",
+            "UPC {upc_code:>14} for {product_name!r}",
+        ]:
+            prompt = LLMPrompt(name="test", query_type="test", prompt_template=template)
+            self.assertEqual(prompt.render(product), template.format(**values))
+
+        prompt = LLMPrompt(name="test", query_type="test", prompt_template="{missing}")
+        with self.assertRaises(KeyError):
+            prompt.render(product)
+
+    def test_prompt_render_skips_unused_additional_data(self):
+        """Test that the DE payload is only loaded when the template uses it"""
+        Product.objects.create(
+            upc_code="123456789012",
+            name="Coffee Beans",
+            de_product_data={"description": "Coffee Beans"},
+        )
+        product = Product.objects.defer("de_product_data").get()
+
+        prompt = LLMPrompt.objects.create(
+            name="test",
+            query_type="test",
+            prompt_template="Product: {product_name}",
+            is_active=True,
+        )
+        with self.assertNumQueries(0):
+            prompt.render(product)
+
+        prompt.prompt_template = "Product: {product_name}, Data: {additional_data}"
+        with self.assertNumQueries(1):
+            rendered = prompt.render(product)
+        self.assertIn("'description': 'Coffee Beans'", rendered)
+
 
 class LLMQueryResultModelTestCase(TestCase):
     """Test LLMQueryResult model"""
@@ -340,6 +889,68 @@ class LLMQueryResultModelTestCase(TestCase):
             is_active=True,
         )
 
+    def test_admin_search_follows_product_renames(self):
+        """Test admin search matches word prefixes and renamed products"""
+        from django.contrib.admin.sites import site
+        from api.admin import LLMQueryResultAdmin
+
+        result = LLMQueryResult.objects.create(
+            product=self.product,
+            prompt=self.prompt,
+            provider="openai",
+            query_input="Test",
+            result={"summary": "Crunchy"},
+        )
+        model_admin = LLMQueryResultAdmin(LLMQueryResult, site)
+
+        def search(term):
+            queryset, _ = model_admin.get_search_results(
+                None, LLMQueryResult.objects.all(), term
+            )
+            return list(queryset)
+
+        self.assertEqual(search("crunch"), [result])
+        self.assertEqual(search("Test Prod"), [result])
+        self.assertEqual(search("Cheer"), [])
+
+        self.product.name = "Cheerios"
+        self.product.save()
+        self.assertEqual(search("Cheer"), [result])
+        self.assertEqual(search("Test Prod"), [])
+
+        # Stopword-only searches fall back to the substring search
+        self.product.name = "The Best of All"
+        self.product.save()
+        self.assertEqual(search("the"), [result])
+        self.assertEqual(search("of all"), [result])
+        self.assertEqual(search("with"), [])
+
+    def test_admin_paginator_estimates_analyzed_tables(self):
+        """Test the admin paginator only trusts reltuples once it is known"""
+        from django.db import connection
+        from api.admin import EstimatedCountPaginator
+
+        LLMQueryResult.objects.create(
+            product=self.product,
+            prompt=self.prompt,
+            provider="openai",
+            query_input="Test",
+            result={"summary": "Ok"},
+        )
+        paginator = EstimatedCountPaginator(LLMQueryResult.objects.all(), 10)
+        paginator.exact_count_threshold = 0
+
+        # Never analyzed: reltuples is -1 (or 0), so COUNT(*) is used
+        with self.assertNumQueries(2):
+            self.assertEqual(paginator.count, 1)
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE api_llmqueryresult")
+        paginator = EstimatedCountPaginator(LLMQueryResult.objects.all(), 10)
+        paginator.exact_count_threshold = 0
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.count, 1)
+
     def test_is_fresh_new_result(self):
         """Test that newly created results are fresh"""
         result = LLMQueryResult.objects.create(
@@ -367,6 +978,44 @@ class LLMQueryResultModelTestCase(TestCase):
 
         self.assertFalse(result.is_fresh(ttl_days=30))
 
+    def test_fresh_queryset(self):
+        """Test that fresh() filters out stale and expired results in SQL"""
+        providers = ["perplexity", "openai", "other"]
+        for provider in providers:
+            LLMQueryResult.objects.create(
+                product=self.product,
+                prompt=self.prompt,
+                provider=provider,
+                query_input="Test",
+                result={"summary": provider},
+                metadata={},
+            )
+        LLMQueryResult.objects.filter(provider="openai").update(is_stale=True)
+        LLMQueryResult.objects.filter(provider="other").update(
+            created_at=timezone.now() - timedelta(days=31)
+        )
+
+        fresh = LLMQueryResult.objects.filter(product=self.product).fresh(ttl_days=30)
+        self.assertEqual([r.provider for r in fresh], ["perplexity"])
+        for result in LLMQueryResult.objects.all():
+            self.assertEqual(result.is_fresh(ttl_days=30), result in fresh)
+
+    def test_with_related_avoids_per_row_queries(self):
+        """Test that listing results with their product and prompt is one query"""
+        for provider in ["perplexity", "openai"]:
+            LLMQueryResult.objects.create(
+                product=self.product,
+                prompt=self.prompt,
+                provider=provider,
+                query_input="Test",
+                result={"summary": provider},
+                metadata={},
+            )
+
+        with self.assertNumQueries(1):
+            labels = [str(r) for r in LLMQueryResult.objects.with_related()]
+        self.assertEqual(len(labels), 2)
+
     def test_unique_constraint(self):
         """Test that (product, prompt, provider) is unique"""
         LLMQueryResult.objects.create(
@@ -452,7 +1101,7 @@ class ProviderCostCalculationTestCase(TestCase):
         # Expected: 10,000/1M * 15.00 = 0.15
         self.assertAlmostEqual(output_cost, 0.15, places=6)
 
-    @patch("api.services.llm.openai_provider.OpenAI")
+    @patch("openai.OpenAI")
     def test_openai_query_includes_accurate_cost(self, mock_openai_class):
         """Test that OpenAI query() returns accurate cost estimates"""
         from api.services.llm.openai_provider import OpenAIProvider
@@ -491,30 +1140,267 @@ class ProviderCostCalculationTestCase(TestCase):
             result["metadata"]["cost_estimate"], expected_cost, places=6
         )
 
-    @patch("httpx.Client")
-    def test_perplexity_query_includes_accurate_cost(self, mock_client_class):
-        """Test that Perplexity query() returns accurate cost estimates"""
-        from api.services.llm.perplexity_provider import PerplexityProvider
+    @patch("openai.OpenAI")
+    def test_openai_request_uses_response_schema(self, mock_openai_class):
+        """Test a response schema is sent as structured output in JSON mode"""
+        from api.services.llm.openai_provider import OpenAIProvider
+        from api.services.llm.schemas import REVIEW_SUMMARY_SCHEMA
 
-        # Mock httpx response with JSON content
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        provider = OpenAIProvider(
+            api_key="test-key", model="gpt-5-nano", structured_outputs=True
+        )
+        params, _, _ = provider._build_request("Test prompt")
+        self.assertEqual(params["response_format"], {"type": "json_object"})
+        self.assertNotIn("top_p", params)
+
+        params, _, _ = provider._build_request(
+            "Test prompt", response_schema=REVIEW_SUMMARY_SCHEMA
+        )
+        json_schema = params["response_format"]["json_schema"]
+        self.assertEqual(params["response_format"]["type"], "json_schema")
+        self.assertEqual(json_schema["name"], "review_summary")
+        self.assertEqual(
+            json_schema["schema"]["properties"]["sentiment_score"]["type"], "number"
+        )
+        self.assertIn("summary", json_schema["schema"]["required"])
+        self.assertNotIn("key_themes", json_schema["schema"]["required"])
+
+    @patch("openai.OpenAI")
+    def test_openai_request_falls_back_to_json_mode(self, mock_openai_class):
+        """Test models without Structured Outputs get plain JSON mode"""
+        from api.services.llm.openai_provider import OpenAIProvider
+        from api.services.llm.schemas import REVIEW_SUMMARY_SCHEMA
+
+        provider = OpenAIProvider(api_key="test-key", model="gpt-4-turbo-preview")
+        params, _, _ = provider._build_request(
+            "Test prompt", response_schema=REVIEW_SUMMARY_SCHEMA
+        )
+        self.assertEqual(params["response_format"], {"type": "json_object"})
+
+    @patch("openai.OpenAI")
+    def test_openai_batch_results_discounted_cost(self, mock_openai_class):
+        """Test batch results are parsed per request and billed at half price"""
+        from api.services.llm.exceptions import LLMInvalidResponseError
+        from api.services.llm.openai_provider import OpenAIProvider
+
+        completion = {
+            "id": "chatcmpl-1",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-5-nano",
             "choices": [
                 {
-                    "message": {
-                        "content": '{"sentiment": "positive", "summary": "Test response"}'
-                    },
+                    "index": 0,
                     "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": '{"summary": "Ok"}'},
                 }
             ],
             "usage": {
-                "total_tokens": 1000,
                 "prompt_tokens": 600,
                 "completion_tokens": 400,
+                "total_tokens": 1000,
             },
-            "citations": [],
         }
+        output = b"\n".join(
+            [
+                json.dumps(
+                    {
+                        "custom_id": "1:1",
+                        "response": {"status_code": 200, "body": completion},
+                    }
+                ).encode(),
+                json.dumps(
+                    {
+                        "custom_id": "2:1",
+                        "response": {"status_code": 400, "body": {"error": "bad"}},
+                    }
+                ).encode(),
+            ]
+        )
+
+        mock_client = Mock()
+        mock_client.batches.retrieve.return_value = Mock(
+            status="completed", output_file_id="file_out", error_file_id=None
+        )
+        mock_client.files.content.return_value = Mock(content=output)
+        mock_openai_class.return_value = mock_client
+
+        provider = OpenAIProvider(api_key="test-key", model="gpt-5-nano")
+        results = provider.get_batch_results("batch_123")
+
+        self.assertEqual(results["1:1"]["content"], {"summary": "Ok"})
+        # Half of the regular 0.00019 (see test_openai_query_includes_accurate_cost)
+        self.assertAlmostEqual(
+            results["1:1"]["metadata"]["cost_estimate"], 0.000095, places=7
+        )
+        self.assertIsInstance(results["2:1"], LLMInvalidResponseError)
+
+        mock_client.batches.retrieve.return_value = Mock(status="in_progress")
+        self.assertIsNone(provider.get_batch_results("batch_123"))
+
+    @patch("openai.OpenAI")
+    def test_openai_batch_prompts_read_from_input_file(self, mock_openai_class):
+        """Test the submitted prompts are read back from the batch input file"""
+        from api.services.llm.openai_provider import OpenAIProvider
+
+        mock_client = Mock()
+        mock_client.files.create.return_value = Mock(id="file_in")
+        mock_client.batches.create.return_value = Mock(id="batch_123")
+        mock_openai_class.return_value = mock_client
+
+        provider = OpenAIProvider(api_key="test-key")
+        provider.submit_batch({"1:1": "First prompt", "2:1": "Second prompt"})
+        _, content = mock_client.files.create.call_args.kwargs["file"]
+
+        mock_client.batches.retrieve.return_value = Mock(input_file_id="file_in")
+        mock_client.files.content.return_value = Mock(content=content)
+
+        self.assertEqual(
+            provider.get_batch_prompts("batch_123"),
+            {"1:1": "First prompt", "2:1": "Second prompt"},
+        )
+        mock_client.files.content.assert_called_with("file_in")
+
+    @patch("openai.AsyncOpenAI")
+    async def test_openai_aquery_includes_accurate_cost(self, mock_async_openai_class):
+        """Test that OpenAI aquery() parses and prices like query()"""
+        from api.services.llm.openai_provider import OpenAIProvider
+
+        mock_response = Mock()
+        mock_response.choices = [
+            Mock(
+                message=Mock(content='{"sentiment": "positive"}'), finish_reason="stop"
+            )
+        ]
+        mock_response.usage = Mock(
+            total_tokens=1000, prompt_tokens=600, completion_tokens=400
+        )
+        mock_response.model = "gpt-5-nano"
+        mock_response.system_fingerprint = "test"
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_async_openai_class.return_value = mock_client
+
+        provider = OpenAIProvider(api_key="test-key", model="gpt-5-nano")
+        result = await provider.aquery("Test prompt")
+        await provider.aquery("Test prompt")
+
+        self.assertEqual(result["content"], {"sentiment": "positive"})
+        self.assertAlmostEqual(result["metadata"]["cost_estimate"], 0.00019, places=6)
+        # One client per event loop
+        mock_async_openai_class.assert_called_once()
+
+    @patch("openai.AsyncOpenAI")
+    def test_openai_async_client_per_event_loop(self, mock_async_openai_class):
+        """Test each event loop gets its own async client; closed loops' are dropped"""
+        from api.services.llm.openai_provider import OpenAIProvider
+
+        mock_async_openai_class.side_effect = lambda **kwargs: Mock()
+        provider = OpenAIProvider(api_key="test-key")
+
+        async def get_clients():
+            return provider._get_async_client(), provider._get_async_client()
+
+        first_loop = asyncio.new_event_loop()
+        first, again = first_loop.run_until_complete(get_clients())
+        self.assertIs(first, again)
+        first_loop.close()
+
+        second_loop = asyncio.new_event_loop()
+        second, _ = second_loop.run_until_complete(get_clients())
+        self.assertIsNot(second, first)
+        self.assertEqual(list(provider.async_clients), [second_loop])
+        second_loop.close()
+
+    @patch("openai.OpenAI")
+    def test_openai_streamed_query(self, mock_openai_class):
+        """Test streamed chunks are assembled like a regular response"""
+        from api.services.llm.exceptions import LLMInvalidResponseError
+        from api.services.llm.openai_provider import OpenAIProvider
+        from openai.types.chat import ChatCompletionChunk
+
+        def chunk(content=None, finish_reason=None, usage=None):
+            return ChatCompletionChunk.model_validate(
+                {
+                    "id": "chatcmpl-1",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": "gpt-5-nano",
+                    "choices": (
+                        []
+                        if usage
+                        else [
+                            {
+                                "index": 0,
+                                "delta": {"content": content},
+                                "finish_reason": finish_reason,
+                            }
+                        ]
+                    ),
+                    "usage": usage,
+                }
+            )
+
+        def stream(*chunks):
+            mock_stream = MagicMock()
+            mock_stream.__enter__.return_value = iter(chunks)
+            return mock_stream
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = stream(
+            chunk('{"sentiment": '),
+            chunk('"positive"}'),
+            chunk(finish_reason="stop"),
+            chunk(
+                usage={
+                    "prompt_tokens": 600,
+                    "completion_tokens": 400,
+                    "total_tokens": 1000,
+                }
+            ),
+        )
+        mock_openai_class.return_value = mock_client
+
+        provider = OpenAIProvider(api_key="test-key", model="gpt-5-nano", stream=True)
+        result = provider.query("Test prompt")
+
+        self.assertEqual(result["content"], {"sentiment": "positive"})
+        self.assertAlmostEqual(result["metadata"]["cost_estimate"], 0.00019, places=6)
+        self.assertTrue(mock_client.chat.completions.create.call_args[1]["stream"])
+
+        # In JSON mode, prose means the response can't parse: stop reading
+        mock_client.chat.completions.create.return_value = stream(
+            chunk("Sure! Here"), chunk(' is {"sentiment": "positive"}')
+        )
+        with self.assertRaises(LLMInvalidResponseError):
+            provider.query("Test prompt")
+
+    @patch("httpx.Client")
+    def test_perplexity_query_includes_accurate_cost(self, mock_client_class):
+        """Test that Perplexity query() returns accurate cost estimates"""
+        from api.services.llm.perplexity_provider import PerplexityProvider
+
+        # Mock httpx response with JSON content
+        mock_response = httpx.Response(
+            200,
+            json={
+                "choices": [
+                    {
+                        "message": {
+                            "content": '{"sentiment": "positive", "summary": "Test response"}'
+                        },
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "total_tokens": 1000,
+                    "prompt_tokens": 600,
+                    "completion_tokens": 400,
+                },
+                "citations": [],
+            },
+        )
 
         mock_client_instance = Mock()
         mock_client_instance.post.return_value = mock_response
@@ -524,6 +1410,8 @@ class ProviderCostCalculationTestCase(TestCase):
 
         provider = PerplexityProvider(api_key="test-key", model="sonar")
         result = provider.query("Test prompt", parse_json=True)
+        body = json.loads(mock_client_instance.post.call_args.kwargs["content"])
+        self.assertEqual(body["model"], "sonar")
 
         # Verify content is parsed as dict
         self.assertIsInstance(result["content"], dict)
@@ -536,6 +1424,222 @@ class ProviderCostCalculationTestCase(TestCase):
             result["metadata"]["cost_estimate"], expected_cost, places=6
         )
 
+    @patch("httpx.AsyncClient")
+    async def test_perplexity_aquery(self, mock_async_client_class):
+        """Test that Perplexity aquery() posts on a pooled async client"""
+        from api.services.llm.exceptions import LLMRateLimitError
+        from api.services.llm.perplexity_provider import PerplexityProvider
+
+        mock_response = httpx.Response(
+            200,
+            json={
+                "choices": [
+                    {
+                        "message": {"content": '{"sentiment": "positive"}'},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "total_tokens": 1000,
+                    "prompt_tokens": 600,
+                    "completion_tokens": 400,
+                },
+            },
+        )
+        mock_client = Mock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        mock_async_client_class.return_value = mock_client
+
+        provider = PerplexityProvider(api_key="test-key", model="sonar")
+        result = await provider.aquery("Test prompt")
+
+        self.assertEqual(result["content"], {"sentiment": "positive"})
+        self.assertAlmostEqual(result["metadata"]["cost_estimate"], 0.001, places=6)
+
+        mock_response.status_code = 429
+        with self.assertRaises(LLMRateLimitError):
+            await provider.aquery("Test prompt")
+        # One client per event loop
+        mock_async_client_class.assert_called_once()
+
+    @patch("httpx.AsyncClient")
+    def test_perplexity_async_client_per_thread_loop(self, mock_async_client_class):
+        """Test threads running their own loops don't share an async client"""
+        from concurrent.futures import ThreadPoolExecutor
+        from api.services.llm.perplexity_provider import PerplexityProvider
+
+        mock_async_client_class.side_effect = lambda **kwargs: Mock()
+        provider = PerplexityProvider(api_key="test-key")
+
+        async def get_client():
+            client = provider._get_async_client()
+            await asyncio.sleep(0.01)
+            return client, provider._get_async_client()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            clients = list(executor.map(lambda _: asyncio.run(get_client()), range(2)))
+
+        for client, again in clients:
+            self.assertIs(client, again)
+        self.assertIsNot(clients[0][0], clients[1][0])
+
+    @patch("api.services.llm.perplexity_provider.time.sleep")
+    @patch("httpx.Client")
+    def test_perplexity_query_retries_rate_limits(self, mock_client_class, mock_sleep):
+        """Test Perplexity backs off on 429s and failed connections only"""
+        from api.services.llm.exceptions import LLMRateLimitError, LLMTimeoutError
+        from api.services.llm.perplexity_provider import PerplexityProvider
+
+        ok = httpx.Response(
+            200,
+            json={
+                "choices": [
+                    {
+                        "message": {"content": '{"sentiment": "positive"}'},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {},
+            },
+        )
+        limited = httpx.Response(429, headers={"Retry-After": "3"})
+        mock_client = mock_client_class.return_value
+        mock_client.post.side_effect = [httpx.ConnectTimeout("down"), limited, ok]
+
+        provider = PerplexityProvider(api_key="test-key", model="sonar", rpm=6000)
+        with patch.object(provider.rate_limiter, "acquire") as mock_acquire:
+            result = provider.query("Test prompt")
+
+        self.assertEqual(result["content"], {"sentiment": "positive"})
+        self.assertEqual(mock_client.post.call_count, 3)
+        # Every HTTP attempt goes through the rate limiter
+        self.assertEqual(mock_acquire.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(mock_sleep.call_args_list[1][0][0], 3.0)
+
+        # A read timeout may have been processed (and billed), so no retry
+        mock_client.post.reset_mock()
+        mock_client.post.side_effect = [httpx.ReadTimeout("slow"), ok]
+        with self.assertRaises(LLMTimeoutError):
+            provider.query("Test prompt")
+        mock_client.post.assert_called_once()
+
+        # Gives up once max_retries or the total backoff budget is used up
+        mock_sleep.reset_mock()
+        mock_client.post.side_effect = [limited, limited]
+        provider = PerplexityProvider(api_key="test-key", max_retries=1)
+        with self.assertRaises(LLMRateLimitError):
+            provider.query("Test prompt")
+
+        mock_client.post.side_effect = [
+            httpx.Response(429, headers={"Retry-After": "120"})
+        ] * 5
+        provider = PerplexityProvider(api_key="test-key", max_retries=4)
+        with self.assertRaises(LLMRateLimitError):
+            provider.query("Test prompt")
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [3.0, 5.0, 5.0])
+
+    @patch("api.services.llm.openai_provider.time.sleep")
+    @patch("openai.OpenAI")
+    def test_openai_query_retries_rate_limits(self, mock_openai_class, mock_sleep):
+        """Test OpenAI retries 429s itself, without the SDK's retries"""
+        import openai
+        from api.services.llm.exceptions import LLMTimeoutError
+        from api.services.llm.openai_provider import OpenAIProvider
+
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        rate_limited = openai.RateLimitError(
+            "slow down",
+            response=httpx.Response(429, headers={"retry-after": "2"}, request=request),
+            body=None,
+        )
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = '{"summary": "Ok"}'
+        mock_response.choices[0].finish_reason = "stop"
+        mock_response.usage.total_tokens = 10
+        mock_response.usage.prompt_tokens = 6
+        mock_response.usage.completion_tokens = 4
+        mock_create = mock_openai_class.return_value.chat.completions.create
+        mock_create.side_effect = [rate_limited, mock_response]
+
+        provider = OpenAIProvider(api_key="test-key", rpm=6000)
+        self.assertEqual(mock_openai_class.call_args.kwargs["max_retries"], 0)
+        with patch.object(provider.rate_limiter, "acquire") as mock_acquire:
+            result = provider.query("Test prompt")
+
+        self.assertEqual(result["content"], {"summary": "Ok"})
+        self.assertEqual(mock_create.call_count, 2)
+        self.assertEqual(mock_acquire.call_count, 2)
+        mock_sleep.assert_called_once_with(2.0)
+
+        mock_create.reset_mock()
+        mock_create.side_effect = openai.APITimeoutError(request=request)
+        with self.assertRaises(LLMTimeoutError):
+            provider.query("Test prompt")
+        mock_create.assert_called_once()
+
+    @patch("api.services.llm.openai_provider.time.sleep")
+    @patch("openai.OpenAI")
+    def test_openai_embed_rate_limited_and_retried(self, mock_openai_class, mock_sleep):
+        """Test embeddings go through the rpm limit and 429 retries"""
+        import openai
+        from api.services.llm.openai_provider import OpenAIProvider
+
+        request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+        rate_limited = openai.RateLimitError(
+            "slow down", response=httpx.Response(429, request=request), body=None
+        )
+        mock_embeddings = mock_openai_class.return_value.embeddings.create
+        mock_embeddings.side_effect = [
+            rate_limited,
+            Mock(data=[Mock(embedding=[1.0, 0.0])]),
+        ]
+
+        provider = OpenAIProvider(api_key="test-key", rpm=6000)
+        with patch.object(provider.rate_limiter, "acquire") as mock_acquire:
+            self.assertEqual(provider.embed("Test prompt"), [1.0, 0.0])
+
+        self.assertEqual(mock_embeddings.call_count, 2)
+        self.assertEqual(mock_acquire.call_count, 2)
+        mock_sleep.assert_called_once()
+
+    @patch("openai.OpenAI")
+    def test_openai_validate_credentials(self, mock_openai_class):
+        """Test OpenAI credentials are checked by listing models"""
+        import openai
+        from api.services.llm.openai_provider import OpenAIProvider
+
+        provider = OpenAIProvider(api_key="test-key")
+        self.assertTrue(provider.validate_credentials())
+        mock_openai_class.return_value.models.list.assert_called_once()
+        mock_openai_class.return_value.chat.completions.create.assert_not_called()
+
+        mock_openai_class.return_value.models.list.side_effect = (
+            openai.AuthenticationError(
+                "bad key",
+                response=httpx.Response(
+                    401, request=httpx.Request("GET", "https://api.openai.com")
+                ),
+                body=None,
+            )
+        )
+        self.assertFalse(provider.validate_credentials())
+
+    @patch("httpx.Client")
+    def test_perplexity_validate_credentials(self, mock_client_class):
+        """Test Perplexity credentials are checked without a completion"""
+        from api.services.llm.perplexity_provider import PerplexityProvider
+
+        mock_client = mock_client_class.return_value
+        provider = PerplexityProvider(api_key="test-key")
+        for status_code, valid in [(400, True), (401, False), (503, False)]:
+            mock_client.post.return_value = httpx.Response(status_code)
+            self.assertIs(provider.validate_credentials(), valid)
+
+        body = json.loads(mock_client.post.call_args.kwargs["content"])
+        self.assertEqual(body["messages"], [])
+
     def test_provider_fallback_on_unknown_model(self):
         """Test that providers handle unknown models gracefully"""
         from api.services.llm.openai_provider import OpenAIProvider
@@ -547,7 +1651,7 @@ class ProviderCostCalculationTestCase(TestCase):
         cost = provider.estimate_cost(1000, is_input=True)
         self.assertGreater(cost, 0.0)
 
-    @patch("api.services.llm.openai_provider.OpenAI")
+    @patch("openai.OpenAI")
     def test_cost_metadata_included_in_response(self, mock_openai_class):
         """Test that cost metadata is properly included in query response"""
         from api.services.llm.openai_provider import OpenAIProvider
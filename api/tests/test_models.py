@@ -59,3 +59,36 @@ class ProductModelTest(MockedAPITestCase):
         product_id = self.product.id
         self.product.delete()
         self.assertEqual(Product.objects.filter(id=product_id).count(), 0)
+
+    def test_has_image_tracks_image_url(self):
+        """Test has_image is kept in sync with image_url on save"""
+        self.assertFalse(self.product.has_image)
+
+        self.product.image_url = "https://example.com/image.jpg"
+        self.product.save(update_fields=["image_url"])
+        self.product.refresh_from_db()
+        self.assertTrue(self.product.has_image)
+
+    def test_de_product_data_round_trip(self):
+        """Test nested JSON survives a save/load and supports key lookups"""
+        data = {
+            "description": "Test Description",
+            "nutrition": {"calories": 120, "sugars": [1.5, None]},
+            "certified": True,
+        }
+        self.product.de_product_data = data
+        self.product.save()
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.de_product_data, data)
+        self.assertTrue(
+            Product.objects.filter(de_product_data__nutrition__calories=120).exists()
+        )
+        self.assertEqual(
+            Product.objects.values_list("de_product_data__nutrition", flat=True).get(),
+            data["nutrition"],
+        )
+
+        self.product.de_product_data = None
+        self.product.save()
+        self.assertTrue(Product.objects.filter(de_product_data__isnull=True).exists())
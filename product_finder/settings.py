@@ -126,6 +126,15 @@ DATABASES = {
     )
 }
 
+# Reuse connections across requests instead of reconnecting every time;
+# health checks replace connections the server has dropped in the meantime
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+# Required when connecting through PgBouncer in transaction pooling mode
+DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = env.bool(
+    "DB_DISABLE_SERVER_SIDE_CURSORS", default=False
+)
+
 # Test database override
 DATABASES["default"]["TEST"] = {
     "NAME": "product_finder_test",
@@ -254,12 +263,32 @@ LLM_CONFIG = {
     "default_provider": env("DEFAULT_LLM_PROVIDER", default="perplexity"),
     "cache_ttl_days": env.int("LLM_CACHE_TTL_DAYS", default=30),
     "enable_caching": env.bool("LLM_ENABLE_CACHING", default=True),
+    "prompt_cache_ttl_seconds": env.int("LLM_PROMPT_CACHE_TTL_SECONDS", default=60),
+    # In-process LRU of recent cache hits in front of the database (0 disables)
+    "result_cache_ttl_seconds": env.int("LLM_RESULT_CACHE_TTL_SECONDS", default=60),
+    # Reuse a product's result for a reworded prompt when the prompt embeddings'
+    # cosine similarity is at least this (0 disables; needs OPENAI_API_KEY).
+    # Every cache miss then makes one extra, billed OpenAI embeddings request
+    "semantic_cache_threshold": env.float("LLM_SEMANTIC_CACHE_THRESHOLD", default=0.0),
+    "embedding_model": env("LLM_EMBEDDING_MODEL", default="text-embedding-3-small"),
+    "max_concurrent_queries": env.int("LLM_MAX_CONCURRENT_QUERIES", default=8),
     "providers": {
         "openai": {
             "api_key": env("OPENAI_API_KEY", default=""),
             "model": env("OPENAI_MODEL", default="gpt-4-turbo-preview"),
             "max_tokens": env.int("OPENAI_MAX_TOKENS", default=500),
             "temperature": env.float("OPENAI_TEMPERATURE", default=0.7),
+            "max_connections": env.int("OPENAI_MAX_CONNECTIONS", default=20),
+            # Retries for rate-limited requests and failed connections, with
+            # backoff capped at 10s in total
+            "max_retries": env.int("OPENAI_MAX_RETRIES", default=2),
+            # Stream completions so bad JSON-mode output is abandoned early
+            "stream": env.bool("OPENAI_STREAM", default=False),
+            # Send response schemas as json_schema Structured Outputs; needs
+            # gpt-4o-2024-08-06 or later (other models use plain JSON mode)
+            "structured_outputs": env.bool("OPENAI_STRUCTURED_OUTPUTS", default=False),
+            # Client-side requests-per-minute limit, retries included (0 = unlimited)
+            "rpm": env.int("OPENAI_RPM", default=0),
         },
         "perplexity": {
             "api_key": env("PERPLEXITY_API_KEY", default=""),
@@ -268,9 +297,18 @@ LLM_CONFIG = {
             ),
             "max_tokens": env.int("PERPLEXITY_MAX_TOKENS", default=500),
             "temperature": env.float("PERPLEXITY_TEMPERATURE", default=0.7),
+            "max_connections": env.int("PERPLEXITY_MAX_CONNECTIONS", default=20),
+            # Retries for rate-limited requests and failed connections, with
+            # backoff capped at 10s in total
+            "max_retries": env.int("PERPLEXITY_MAX_RETRIES", default=2),
+            # Client-side requests-per-minute limit, retries included (0 = unlimited)
+            "rpm": env.int("PERPLEXITY_RPM", default=0),
         },
     },
 }
+# Connect to the configured LLM providers when the app starts (off by default
+# so management commands and tests don't open network connections)
+LLM_WARMUP_ON_STARTUP = env.bool("LLM_WARMUP_ON_STARTUP", default=False)
 
 
 # DE Product API Configuration
@@ -280,6 +318,13 @@ DE_PRODUCT_CONFIG = {
     "auth_key": env("DE_PRODUCT_AUTH_KEY", default=""),
     "field_names": env("DE_PRODUCT_FIELD_NAMES", default=""),
     "language": env("DE_PRODUCT_LANGUAGE", default="en"),
+    "max_workers": env.int("DE_PRODUCT_MAX_WORKERS", default=16),
+    "cache_ttl_seconds": env.int(
+        "DE_PRODUCT_CACHE_TTL_SECONDS", default=7 * 24 * 60 * 60
+    ),
+    "not_found_cache_ttl_seconds": env.int(
+        "DE_PRODUCT_NOT_FOUND_CACHE_TTL_SECONDS", default=60 * 60
+    ),
 }
 
 